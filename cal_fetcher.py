@@ -1,15 +1,47 @@
 """Fetch ICS calendar URLs and return events for the coming week or for a target ISO week."""
 
+from __future__ import annotations
+
+import asyncio
+import bisect
+import heapq
+import pickle
+import re
 from collections import defaultdict
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import date, datetime, timedelta, timezone
-from typing import Optional, Union
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional, Union
 from zoneinfo import ZoneInfo
 
-import httpx
-import icalendar
-
 import config
+import http_cache
+
+if TYPE_CHECKING:
+    import httpx
+
+# DTSTART/DTEND date (YYYYMMDD) of a VEVENT block, read without a full ICS parse
+_FAST_DTSTART_RE = re.compile(r"^DTSTART[^:\r\n]*:(\d{8})", re.MULTILINE)
+_FAST_DTEND_RE = re.compile(r"^DTEND[^:\r\n]*:(\d{8})", re.MULTILINE)
+
+# RFC 5545 line folding (CRLF/LF followed by one space or tab) and text escapes
+_ICS_FOLD_RE = re.compile(r"\r?\n[ \t]")
+_ICS_ESCAPE_RE = re.compile(r"\\([\\;,nN])")
+# VEVENT properties read by the fast parser; any recurrence property sends the feed to icalendar
+_FAST_PROPS = frozenset({"SUMMARY", "DTSTART", "DTEND", "LOCATION"})
+_RECURRENCE_PROPS = frozenset({"RRULE", "RDATE", "RECURRENCE-ID", "DURATION"})
+# A VEVENT with any of these is a series that recurring_ical_events must expand (only VEVENT blocks are
+# searched: VTIMEZONE STANDARD/DAYLIGHT rules use RRULE too, and most feeds with a TZID have them)
+_RECURRING_FEED_RE = re.compile(r"^(?:RRULE|RDATE)[;:]", re.MULTILINE | re.IGNORECASE)
+
+# One pooled client serves all feeds of a fetch, so feeds on the same host share TCP/TLS (and HTTP/2).
+_HTTP_MAX_CONNECTIONS = 16
+
+try:
+    _CAL_TZ: Union[ZoneInfo, timezone] = ZoneInfo(config.CALENDAR_TIMEZONE)
+except Exception:
+    _CAL_TZ = timezone.utc
 
 
 @dataclass
@@ -22,6 +54,10 @@ class CalendarEvent:
     location: Optional[str] = None
 
 
+def _event_start(e: CalendarEvent) -> datetime:
+    return e.start
+
+
 def _to_datetime(val) -> Optional[datetime]:
     """Convert icalendar date or datetime to timezone-aware datetime."""
     if val is None:
@@ -37,101 +73,385 @@ def _to_datetime(val) -> Optional[datetime]:
 
 def _parse_dt(component, key: str) -> Optional[datetime]:
     """Get a datetime from an icalendar component (DTSTART/DTEND)."""
-    val = component.get(key)
-    if val is None:
+    # vDDDTypes (and the other date property types) expose .dt; anything else has no usable value.
+    return _to_datetime(getattr(component.get(key), "dt", None))
+
+
+def _event_from_component(component) -> Optional[CalendarEvent]:
+    """CalendarEvent from a VEVENT component, or None if it has no usable DTSTART."""
+    start = _parse_dt(component, "DTSTART")
+    if start is None:
         return None
-    if isinstance(val, icalendar.vDDDTypes):
-        return _to_datetime(val.dt)
-    return None
+    summary = str(component.get("SUMMARY", ""))
+    end = _parse_dt(component, "DTEND")
+    location = component.get("LOCATION")
+    location = str(location) if location else None
+    return CalendarEvent(summary=summary, start=start, end=end, location=location)
 
 
-def _get_events_from_ics(ics_text: str) -> list[CalendarEvent]:
-    """Parse ICS string and return list of CalendarEvent (no recurrence expansion)."""
-    cal = icalendar.Calendar.from_ical(ics_text)
+def _events_from_parsed(cal) -> list[CalendarEvent]:
+    """List of CalendarEvent from an already parsed icalendar.Calendar (no recurrence expansion)."""
     events: list[CalendarEvent] = []
     for component in cal.walk():
         if component.name != "VEVENT":
             continue
-        summary = str(component.get("SUMMARY", ""))
-        start = _parse_dt(component, "DTSTART")
-        if start is None:
-            continue
-        end = _parse_dt(component, "DTEND")
-        location = component.get("LOCATION")
-        location = str(location) if location else None
-        events.append(
-            CalendarEvent(summary=summary, start=start, end=end, location=location)
-        )
+        event = _event_from_component(component)
+        if event is not None:
+            events.append(event)
     return events
 
 
+def _ics_unescape(value: str) -> str:
+    """Unescape an ICS TEXT value (backslash-escaped backslash, semicolon, comma and newline)."""
+    return _ICS_ESCAPE_RE.sub(lambda m: "\n" if m.group(1) in "nN" else m.group(1), value)
+
+
+def _split_content_line(line: str) -> tuple[str, list[str], str]:
+    """Split 'NAME;PARAM=x:value' into (NAME, params, value). Raises ValueError if there is no value."""
+    colon = line.index(":")
+    head = line[:colon]
+    if '"' in head:
+        # Quoted parameter values may contain ':'; find the first colon outside quotes.
+        in_quotes = False
+        for colon, ch in enumerate(line):
+            if ch == '"':
+                in_quotes = not in_quotes
+            elif ch == ":" and not in_quotes:
+                break
+        else:
+            raise ValueError(line)
+        head = line[:colon]
+    name, *params = head.split(";")
+    return name.upper(), params, line[colon + 1:]
+
+
+def _fast_parse_ics_dt(params: list[str], value: str) -> tuple[datetime, bool]:
+    """
+    Parse YYYYMMDD / YYYYMMDDTHHMMSS[Z] (with optional TZID).
+    Returns (datetime, is_date); dates and floating times are naive (local to the requested window,
+    as in recurring_ical_events). Raises ValueError (or ZoneInfo errors) for anything else.
+    """
+    v = value.strip()
+    if len(v) == 8:
+        return datetime(int(v[:4]), int(v[4:6]), int(v[6:8])), True
+    if len(v) not in (15, 16) or v[8] not in "Tt":
+        raise ValueError(value)
+    naive = datetime(int(v[:4]), int(v[4:6]), int(v[6:8]), int(v[9:11]), int(v[11:13]), int(v[13:15]))
+    if len(v) == 16:
+        if v[15] not in "Zz":
+            raise ValueError(value)
+        return naive.replace(tzinfo=timezone.utc), False
+    for p in params:
+        key, _, tzid = p.partition("=")
+        if key.upper() == "TZID":
+            return naive.replace(tzinfo=ZoneInfo(tzid.strip('"'))), False
+    return naive, False  # floating time
+
+
+def _fast_event(props: dict[str, tuple[list[str], str]]) -> Optional[CalendarEvent]:
+    """CalendarEvent from the raw properties of one VEVENT (None without DTSTART)."""
+    if "DTSTART" not in props:
+        return None
+    start, is_date = _fast_parse_ics_dt(*props["DTSTART"])
+    if "DTEND" in props:
+        end, _ = _fast_parse_ics_dt(*props["DTEND"])
+        if end < start:
+            raise ValueError("DTEND before DTSTART")  # leave malformed events to the full parser
+    else:
+        # Same default end as recurring_ical_events: one day for all-day events, else zero length.
+        end = start + timedelta(days=1) if is_date else start
+    summary = _ics_unescape(props["SUMMARY"][1]) if "SUMMARY" in props else ""
+    location = _ics_unescape(props["LOCATION"][1]) if "LOCATION" in props else ""
+    return CalendarEvent(summary=summary, start=start, end=end, location=location or None)
+
+
+def _fast_parse_vevents(ics_text: str) -> Optional[list[CalendarEvent]]:
+    """
+    Line-based VEVENT scanner for feeds without recurrence: reads only SUMMARY, DTSTART, DTEND and
+    LOCATION, skipping icalendar's generic per-property parsing.
+    Returns None if the feed needs the full parser (RRULE/RDATE/RECURRENCE-ID/DURATION, an unknown
+    TZID, unusual date formats or repeated properties).
+    """
+    events: list[CalendarEvent] = []
+    props: Optional[dict[str, tuple[list[str], str]]] = None
+    depth = 0  # nesting inside the current VEVENT (e.g. VALARM)
+    try:
+        for line in _ICS_FOLD_RE.sub("", ics_text).splitlines():
+            if not line:
+                continue
+            name, params, value = _split_content_line(line)
+            if name == "BEGIN":
+                if props is None:
+                    if value.strip().upper() == "VEVENT":
+                        props = {}
+                else:
+                    depth += 1
+            elif props is None:
+                continue
+            elif name == "END":
+                if depth:
+                    depth -= 1
+                else:
+                    event = _fast_event(props)
+                    if event is not None:
+                        events.append(event)
+                    props = None
+            elif depth:
+                continue
+            elif name in _RECURRENCE_PROPS:
+                return None
+            elif name in _FAST_PROPS:
+                if name in props:
+                    return None
+                props[name] = (params, value)
+    except Exception:
+        return None
+    return events
+
+
+def _in_range(e: CalendarEvent, from_date: datetime, end_date: datetime) -> bool:
+    """
+    Same inclusion rule as recurring_ical_events.between: starts inclusive, ends exclusive.
+    Naive (all-day or floating) times are taken in from_date's timezone.
+    """
+    start = e.start if e.start.tzinfo else e.start.replace(tzinfo=from_date.tzinfo)
+    end = e.end or e.start
+    if end.tzinfo is None:
+        end = end.replace(tzinfo=from_date.tzinfo)
+    if end == start:
+        return from_date <= start < end_date
+    return start < end_date and end > from_date
+
+
+def _floating_as_utc(e: CalendarEvent) -> CalendarEvent:
+    """Pin naive fast-parser times to UTC, as _to_datetime does for dates and floating times."""
+    if e.start.tzinfo is None:
+        e.start = e.start.replace(tzinfo=timezone.utc)
+    if e.end is not None and e.end.tzinfo is None:
+        e.end = e.end.replace(tzinfo=timezone.utc)
+    return e
+
+
+def _fast_date(m: re.Match) -> date:
+    d = m.group(1)
+    return date(int(d[:4]), int(d[4:6]), int(d[6:8]))
+
+
+def _vevent_may_overlap(block: str, lo: date, hi: date) -> bool:
+    """
+    Cheap check on one raw VEVENT block: False only if it certainly lies outside lo..hi.
+    Recurring or overriding events (RRULE/RDATE/RECURRENCE-ID) and blocks we can't read are kept.
+    """
+    if "RRULE" in block or "RDATE" in block or "RECURRENCE-ID" in block:
+        return True
+    m = _FAST_DTSTART_RE.search(block)
+    if not m:
+        return True
+    try:
+        start = _fast_date(m)
+        if "DURATION" in block:
+            return start <= hi
+        m = _FAST_DTEND_RE.search(block)
+        end = _fast_date(m) if m else start
+        if end < start:
+            return True  # malformed (DTEND before DTSTART): let the full parser decide
+        return start <= hi and end >= lo
+    except ValueError:
+        return True
+
+
+def _prefilter_ics(ics_text: str, from_date: datetime, end_date: datetime) -> tuple[str, bool]:
+    """
+    Drop VEVENT blocks that clearly fall outside from_date..end_date before the full parse,
+    so multi-year feeds don't materialize thousands of irrelevant events.
+    One day of slack on each side covers any timezone offset.
+    Returns (text, recurring): recurring is True if a VEVENT has RRULE/RDATE lines (series that
+    recurring_ical_events must expand), found in the same pass (recurring blocks are never dropped).
+    """
+    parts = ics_text.split("BEGIN:VEVENT")
+    if len(parts) < 2:
+        return ics_text, False
+    lo = from_date.date() - timedelta(days=1)
+    hi = end_date.date() + timedelta(days=1)
+    out = [parts[0]]
+    dropped = False
+    recurring = False
+    for chunk in parts[1:]:
+        end_idx = chunk.find("END:VEVENT")
+        block = chunk if end_idx == -1 else chunk[:end_idx]
+        if not recurring and _RECURRING_FEED_RE.search(block):
+            recurring = True
+        if end_idx == -1 or _vevent_may_overlap(block, lo, hi):
+            out.append("BEGIN:VEVENT" + chunk)
+            continue
+        # Keep whatever follows the event (next component, END:VCALENDAR), minus its line break.
+        rest = chunk[end_idx + len("END:VEVENT"):]
+        out.append(rest[2:] if rest.startswith("\r\n") else rest.lstrip("\n"))
+        dropped = True
+    return ("".join(out) if dropped else ics_text), recurring
+
+
 def _get_events_from_ics_between(
     ics_text: str,
     from_date: datetime,
     end_date: datetime,
-) -> list[CalendarEvent]:
+    recurring: Optional[bool] = None,
+) -> tuple[list[CalendarEvent], bool]:
     """
-    Parse ICS and return events in the given range, with recurring events expanded to instances.
-    Falls back to _get_events_from_ics + date filter if recurring_ical_events is not available.
+    Parse ICS and return (events in the given range, recurring), with recurring events expanded to
+    instances. recurring: whether a VEVENT has RRULE/RDATE; pass the cached value if known, otherwise
+    it is found while prefiltering and returned so the caller can cache it.
+    Feeds without recurrence go through the line-based _fast_parse_vevents; recurring feeds go
+    straight to the full parser. The feed is parsed once; if recurring_ical_events is not available
+    (or fails), the same parsed calendar is used without expansion and filtered by date.
     """
+    ics_text, has_recurrence = _prefilter_ics(ics_text, from_date, end_date)
+    if recurring is None:
+        recurring = has_recurrence
+    if not recurring:
+        fast_events = _fast_parse_vevents(ics_text)
+        if fast_events is not None:
+            return [_floating_as_utc(e) for e in fast_events if _in_range(e, from_date, end_date)], recurring
+    import icalendar
+
+    cal = icalendar.Calendar.from_ical(ics_text)
     try:
         import recurring_ical_events
     except ImportError:
-        raw = _get_events_from_ics(ics_text)
-        return [e for e in raw if from_date <= e.start <= end_date]
+        return [e for e in _events_from_parsed(cal) if from_date <= e.start <= end_date], recurring
 
-    cal = icalendar.Calendar.from_ical(ics_text)
     events: list[CalendarEvent] = []
     try:
         for component in recurring_ical_events.of(cal, skip_bad_series=True).between(
             from_date, end_date
         ):
-            start = _parse_dt(component, "DTSTART")
-            if start is None:
-                continue
-            summary = str(component.get("SUMMARY", ""))
-            end = _parse_dt(component, "DTEND")
-            location = component.get("LOCATION")
-            location = str(location) if location else None
-            events.append(
-                CalendarEvent(summary=summary, start=start, end=end, location=location)
-            )
+            event = _event_from_component(component)
+            if event is not None:
+                events.append(event)
     except Exception:
-        raw = _get_events_from_ics(ics_text)
-        return [e for e in raw if from_date <= e.start <= end_date]
-    return events
+        return [e for e in _events_from_parsed(cal) if from_date <= e.start <= end_date], recurring
+    return events, recurring
 
 
+@lru_cache(maxsize=256)
 def _normalize_calendar_url(url: str) -> str:
     """Allow webcal: links (same as https: for fetching)."""
-    u = (url or "").strip()
-    if u.lower().startswith("webcal://"):
-        return "https://" + u[9:]
-    return u
+    return config.normalize_calendar_url(url)
 
 
-def _fetch_events_from_urls(
+def _cache_path(url: str) -> Path:
+    """Cache file for a normalized calendar URL."""
+    return http_cache.cache_path("ics", url, ".pkl")
+
+
+def _cache_get(url: str) -> dict[str, Any] | None:
+    """
+    Cached entry for url, or None if missing/unreadable.
+    Keys: etag, last_modified, ics_text, recurring_vevents (a VEVENT has RRULE/RDATE), window ([from, end] isoformat)
+    and events (CalendarEvent list) parsed for that window.
+    """
+    return http_cache.read_entry(_cache_path(url), pickle.loads)
+
+
+def _cache_put(url: str, entry: dict[str, Any]) -> None:
+    """Write cache entry for url. Failures (e.g. unpicklable event values) are ignored."""
+    http_cache.write_entry(
+        _cache_path(url), entry, lambda e: pickle.dumps(e, protocol=pickle.HIGHEST_PROTOCOL)
+    )
+
+
+async def _get_ics_responses(
     urls: list[str],
+    headers: list[dict[str, str]],
+) -> list[Union[httpx.Response, BaseException]]:
+    """Fetch all URLs concurrently over one client. Failed requests are returned as exceptions."""
+    import httpx
+
+    limits = httpx.Limits(
+        max_connections=_HTTP_MAX_CONNECTIONS, max_keepalive_connections=_HTTP_MAX_CONNECTIONS
+    )
+    async with httpx.AsyncClient(
+        follow_redirects=True, timeout=15.0, http2=True, limits=limits
+    ) as client:
+        return await asyncio.gather(
+            *(client.get(url, headers=h) for url, h in zip(urls, headers)),
+            return_exceptions=True,
+        )
+
+
+def _events_for_response(
+    url: str,
+    resp: httpx.Response,
+    entry: dict[str, Any] | None,
     from_date: datetime,
     end_date: datetime,
 ) -> list[CalendarEvent]:
-    """Fetch and filter events from a list of ICS URLs."""
-    events: list[CalendarEvent] = []
-    for url in urls:
-        url = _normalize_calendar_url(url)
-        if not url:
-            continue
-        try:
-            resp = httpx.get(url, follow_redirects=True, timeout=15.0)
-            resp.raise_for_status()
-            for e in _get_events_from_ics_between(resp.text, from_date, end_date):
-                events.append(e)
-        except Exception:
-            continue
-    events.sort(key=lambda e: e.start)
+    """
+    Events for one fetched URL. On 304 the cached feed is reused (and its parsed events, if they
+    were parsed for the same window); otherwise the new feed is parsed and the cache overwritten.
+    """
+    window = [from_date.isoformat(), end_date.isoformat()]
+    if resp.status_code == 304 and entry and entry.get("ics_text") is not None:
+        if entry.get("window") == window:
+            return list(entry.get("events") or [])
+        ics_text = entry["ics_text"]
+    else:
+        resp.raise_for_status()
+        ics_text = resp.text
+        entry = {
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+            "ics_text": ics_text,
+        }
+    # A fresh feed has no recurring_vevents yet; the prefilter pass finds it
+    events, entry["recurring_vevents"] = _get_events_from_ics_between(
+        ics_text, from_date, end_date, entry.get("recurring_vevents")
+    )
+    entry["window"] = window
+    entry["events"] = events
+    _cache_put(url, entry)
     return events
 
 
+def _fetch_events_per_url(
+    urls: list[str],
+    from_date: datetime,
+    end_date: datetime,
+) -> dict[str, list[CalendarEvent]]:
+    """
+    Fetch ICS URLs concurrently (conditional GET against the on-disk cache) and return
+    start-sorted events per normalized URL. URLs that fail to download or parse map to an empty list.
+    """
+    unique_urls = list(dict.fromkeys(u for u in map(_normalize_calendar_url, urls) if u))
+    if not unique_urls:
+        return {}
+    entries = [_cache_get(url) for url in unique_urls]
+    responses = asyncio.run(
+        _get_ics_responses(unique_urls, [http_cache.conditional_headers(e) for e in entries])
+    )
+    url_to_events: dict[str, list[CalendarEvent]] = {}
+    for url, entry, resp in zip(unique_urls, entries, responses):
+        events: list[CalendarEvent] = []
+        if not isinstance(resp, BaseException):
+            try:
+                events = _events_for_response(url, resp, entry, from_date, end_date)
+            except Exception:
+                events = []
+        events.sort(key=_event_start)
+        url_to_events[url] = events
+    return url_to_events
+
+
+def _fetch_events_from_urls(
+    urls: list[str],
+    from_date: datetime,
+    end_date: datetime,
+) -> list[CalendarEvent]:
+    """Fetch and filter events from a list of ICS URLs (fetched concurrently)."""
+    per_url = _fetch_events_per_url(urls, from_date, end_date)
+    return list(heapq.merge(*per_url.values(), key=_event_start))
+
+
 def _week_range_in_tz(
     target_week: int,
     reference_date: date | None = None,
@@ -141,22 +461,29 @@ def _week_range_in_tz(
         reference_date = date.today()
     next_week_date = reference_date + timedelta(days=7)
     iso_year, _, _ = next_week_date.isocalendar()
-    try:
-        tz = ZoneInfo(config.CALENDAR_TIMEZONE)
-    except Exception:
-        tz = timezone.utc
     monday = date.fromisocalendar(iso_year, target_week, 1)
     sunday = date.fromisocalendar(iso_year, target_week, 7)
-    start = datetime.combine(monday, datetime.min.time(), tzinfo=tz)
-    end = datetime.combine(sunday, datetime.max.time().replace(microsecond=999999), tzinfo=tz)
+    start = datetime.combine(monday, datetime.min.time(), tzinfo=_CAL_TZ)
+    end = datetime.combine(sunday, datetime.max.time().replace(microsecond=999999), tzinfo=_CAL_TZ)
     return start, end
 
 
-def _event_date_in_tz(e: CalendarEvent, tz: Union[ZoneInfo, timezone]) -> date:
-    """Event start date in the given timezone (for week filtering)."""
-    if e.start.tzinfo is not None:
-        return e.start.astimezone(tz).date()
-    return e.start.replace(tzinfo=tz).date()
+def _week_bounds(week_start: datetime) -> tuple[datetime, datetime]:
+    """Local midnight (as UTC) of the Monday starting at week_start and of the next Monday."""
+    monday = week_start.date()
+    start = datetime.combine(monday, datetime.min.time(), tzinfo=_CAL_TZ)
+    end = datetime.combine(monday + timedelta(days=7), datetime.min.time(), tzinfo=_CAL_TZ)
+    return start.astimezone(timezone.utc), end.astimezone(timezone.utc)
+
+
+def _events_in_week(events: list[CalendarEvent], week_bounds: tuple[datetime, datetime]) -> list[CalendarEvent]:
+    """
+    Events starting Monday..Sunday (CALENDAR_TIMEZONE) of the week given by week_bounds (see _week_bounds).
+    events must be sorted by (aware) start, so the week is one contiguous slice found with two bisects.
+    """
+    lo = bisect.bisect_left(events, week_bounds[0], key=_event_start)
+    hi = bisect.bisect_left(events, week_bounds[1], lo=lo, key=_event_start)
+    return events[lo:hi]
 
 
 def _calendar_person_names() -> set[str]:
@@ -167,18 +494,52 @@ def _calendar_person_names() -> set[str]:
     return names
 
 
-def _event_belongs_to_person(event: CalendarEvent, person_name: str, all_names: set[str]) -> bool:
+# PERSON_CALENDARS is fixed after import; compute the (lowercased name, name) pairs once.
+_ALL_NAMES_LOWER = tuple((n.lower(), n) for n in _calendar_person_names() if n)
+
+
+def _names_in_summary(event: CalendarEvent, all_names_lower: tuple[tuple[str, str], ...]) -> frozenset[str]:
+    """Person names (from (lowercased, name) pairs) that appear in the event summary, ignoring case."""
+    summary_lower = (event.summary or "").lower()
+    return frozenset(n for low, n in all_names_lower if low in summary_lower)
+
+
+def _group_events_by_person(
+    url_to_events: dict[str, list[CalendarEvent]],
+    event_names: dict[int, frozenset[str]] | None = None,
+) -> list[tuple[str, list[CalendarEvent]]]:
     """
-    True if this event should be shown for this person.
-    If the event summary contains a person's name, show only for that person; otherwise show for everyone with that calendar.
+    Group per-URL events by person using PERSON_CALENDARS, sorted by person name.
+    If event_names (id(event) -> names in summary) is given, an event whose summary contains person names
+    is shown only for those persons; otherwise it is shown for everyone with that calendar.
     """
-    summary = (event.summary or "").strip()
-    if not all_names:
-        return True
-    names_in_summary = [n for n in all_names if n and n in summary]
-    if not names_in_summary:
-        return True  # no name in summary -> show for all
-    return person_name in names_in_summary
+    # Per-URL lists are start-sorted; keep them separate and k-way merge per person.
+    by_person_lists: dict[str, list[list[CalendarEvent]]] = defaultdict(list)
+    for names, url in config.PERSON_CALENDARS_NORMALIZED:
+        events = url_to_events.get(url, [])
+        if event_names is None:
+            for name in names:
+                by_person_lists[name].append(events)
+            continue
+        # One pass over the events per calendar, dispatching each event to its persons' lists.
+        kept: dict[str, list[CalendarEvent]] = {name: [] for name in names}
+        for e in events:
+            in_summary = event_names[id(e)]
+            if not in_summary:  # no name in summary -> show for all
+                for person_events in kept.values():
+                    person_events.append(e)
+                continue
+            for name in in_summary:
+                person_events = kept.get(name)
+                if person_events is not None:
+                    person_events.append(e)
+        for name, person_events in kept.items():
+            if person_events:
+                by_person_lists[name].append(person_events)
+    result: list[tuple[str, list[CalendarEvent]]] = []
+    for name in sorted(by_person_lists.keys()):
+        result.append((name, list(heapq.merge(*by_person_lists[name], key=_event_start))))
+    return result
 
 
 def fetch_events_for_week(
@@ -190,45 +551,27 @@ def fetch_events_for_week(
 
     Returns same shape as fetch_events_next_week: list of (person_name, events).
     reference_date is used to resolve the ISO year (default: today); the week is the one containing reference_date + 7 days.
-    Events are filtered by: (1) start date in calendar tz falls in the week, (2) if summary contains a person name, only that person sees it.
+    Events are filtered by: (1) start date in calendar tz falls in the week, (2) if summary contains a person name (ignoring case), only that person sees it.
     """
     start, end = _week_range_in_tz(target_week, reference_date)
-    try:
-        tz = ZoneInfo(config.CALENDAR_TIMEZONE)
-    except Exception:
-        tz = timezone.utc
-    week_dates = {start.date() + timedelta(days=i) for i in range(7)}
-    all_names = _calendar_person_names()
+    week_bounds = _week_bounds(start)
+    all_names_lower = _ALL_NAMES_LOWER
     result: list[tuple[str, list[CalendarEvent]]] = []
 
     if config.PERSON_CALENDARS:
-        normalized_to_original: dict[str, str] = {}
-        for _, url in config.PERSON_CALENDARS:
-            n = _normalize_calendar_url(url)
-            if n and n not in normalized_to_original:
-                normalized_to_original[n] = url
-        url_to_events: dict[str, list[CalendarEvent]] = {}
-        for norm_url in normalized_to_original:
-            raw = _fetch_events_from_urls([norm_url], start, end)
-            url_to_events[norm_url] = [
-                e for e in raw
-                if _event_date_in_tz(e, tz) in week_dates
-            ]
-        by_person_events: dict[str, list[CalendarEvent]] = defaultdict(list)
-        for names, url in config.PERSON_CALENDARS:
-            key = _normalize_calendar_url(url) or url
-            events = url_to_events.get(key, [])
-            for name in names:
-                for e in events:
-                    if _event_belongs_to_person(e, name, all_names):
-                        by_person_events[name].append(e)
-        for name in sorted(by_person_events.keys()):
-            events = by_person_events[name]
-            events.sort(key=lambda e: e.start)
-            result.append((name, events))
+        url_to_events = _fetch_events_per_url(config.UNIQUE_CALENDAR_URLS, start, end)
+        for norm_url, raw in url_to_events.items():
+            url_to_events[norm_url] = _events_in_week(raw, week_bounds)
+        # Names in each summary are computed once per event, not once per (person, event).
+        event_names = {
+            id(e): _names_in_summary(e, all_names_lower)
+            for events in url_to_events.values()
+            for e in events
+        }
+        result = _group_events_by_person(url_to_events, event_names)
     elif config.ICS_URLS:
         raw = _fetch_events_from_urls(config.ICS_URLS, start, end)
-        events = [e for e in raw if _event_date_in_tz(e, tz) in week_dates]
+        events = _events_in_week(raw, week_bounds)
         result.append(("", events))
     return result
 
@@ -250,25 +593,8 @@ def fetch_events_next_week(
 
     if config.PERSON_CALENDARS:
         # Fetch each URL once (shared calendars may appear in multiple entries).
-        # Normalize webcal:// to https:// so the same calendar isn't fetched twice.
-        normalized_to_original: dict[str, str] = {}
-        for _, url in config.PERSON_CALENDARS:
-            n = _normalize_calendar_url(url)
-            if n and n not in normalized_to_original:
-                normalized_to_original[n] = url
-        url_to_events: dict[str, list[CalendarEvent]] = {}
-        for norm_url in normalized_to_original:
-            url_to_events[norm_url] = _fetch_events_from_urls([norm_url], from_date, end_date)
-        by_person_events: dict[str, list[CalendarEvent]] = defaultdict(list)
-        for names, url in config.PERSON_CALENDARS:
-            key = _normalize_calendar_url(url) or url
-            events = url_to_events.get(key, [])
-            for name in names:
-                by_person_events[name].extend(events)
-        for name in sorted(by_person_events.keys()):
-            events = by_person_events[name]
-            events.sort(key=lambda e: e.start)
-            result.append((name, events))
+        url_to_events = _fetch_events_per_url(config.UNIQUE_CALENDAR_URLS, from_date, end_date)
+        result = _group_events_by_person(url_to_events)
     elif config.ICS_URLS:
         events = _fetch_events_from_urls(config.ICS_URLS, from_date, end_date)
         result.append(("", events))
@@ -4,17 +4,18 @@ import os
 import re
 from pathlib import Path
 
+# One KEY=value assignment per line: "quoted" / 'quoted' value, or bare value up to an inline # comment.
+_ENV_RE = re.compile(
+    r"""^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(?:"([^"\n]*)"|'([^'\n]*)'|([^#\n]*))""",
+    re.MULTILINE,
+)
+
 # Load .env file if present (simple parse, no extra dependency). .env overrides existing env so changes take effect.
 _env_path = Path(__file__).resolve().parent / ".env"
 if _env_path.exists():
-    for line in _env_path.read_text().splitlines():
-        line = line.strip()
-        if line and not line.startswith("#") and "=" in line:
-            key, _, value = line.partition("=")
-            key = key.strip()
-            value = value.split("#")[0].strip().strip('"').strip("'")  # drop inline comments
-            if key:
-                os.environ[key] = value
+    for _m in _ENV_RE.finditer(_env_path.read_text()):
+        _dq, _sq, _bare = _m.group(2, 3, 4)
+        os.environ[_m.group(1)] = _dq if _dq is not None else _sq if _sq is not None else _bare.strip()
 
 # Person + school class: one entry per person who has a class page. Format: Name|ClassLabel|URL
 # Example: Alice|6B|https://...,Bob|8B|https://... (names and class labels are configurable)
@@ -55,6 +56,22 @@ for entry in _person_cal_raw.split(","):
     if names and url:
         PERSON_CALENDARS.append((names, url))
 
+
+def normalize_calendar_url(url: str) -> str:
+    """Allow webcal: links (same as https: for fetching)."""
+    u = (url or "").strip()
+    if u.lower().startswith("webcal://"):
+        return "https://" + u[9:]
+    return u
+
+
+# PERSON_CALENDARS with URLs normalized (webcal:// -> https://), and each distinct calendar URL once
+# (shared calendars may appear in several entries; fetch each only once).
+PERSON_CALENDARS_NORMALIZED: list[tuple[list[str], str]] = [
+    (names, normalize_calendar_url(url)) for names, url in PERSON_CALENDARS
+]
+UNIQUE_CALENDAR_URLS: list[str] = list(dict.fromkeys(url for _, url in PERSON_CALENDARS_NORMALIZED))
+
 # Fallback: global ICS URLs (no person); used when PERSON_CALENDARS is empty
 _ics = os.environ.get("ICS_URLS", "")
 ICS_URLS = [u.strip() for u in _ics.split(",") if u.strip()]
@@ -78,6 +95,16 @@ DIGEST_SNAPSHOT_DIR = (
     or str(Path(__file__).resolve().parent / ".digest_snapshots")
 )
 
+# Directory for caches: calendar feeds and school pages (ETag/Last-Modified), parsed school highlights, LLM responses. Default: .cache
+CACHE_DIR = (
+    os.environ.get("CACHE_DIR", "").strip()
+    or str(Path(__file__).resolve().parent / ".cache")
+)
+
+# Reuse LLM responses for identical prompts (stored under CACHE_DIR/llm; entries unused for 14 days are
+# pruned). Set LLM_CACHE=0 to always call the API.
+LLM_CACHE = os.environ.get("LLM_CACHE", "1").strip().lower() not in ("0", "false", "no")
+
 
 def get_special_info(person_name: str) -> str | None:
     """
@@ -2,6 +2,7 @@
 
 from collections import defaultdict
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 import config
@@ -16,77 +17,95 @@ _MONTH_SV = (
 )
 
 
-def _week_dates(target_week: int, reference_date: date | None = None) -> list[date]:
-    """Return [Monday, ..., Sunday] for the given ISO week (year from reference_date + 7 days)."""
+@lru_cache(maxsize=8)
+def _get_tz(name: str | None) -> ZoneInfo | None:
+    """ZoneInfo for name, or None if name is empty or unknown. Cached per name."""
+    if not name:
+        return None
+    try:
+        return ZoneInfo(name)
+    except Exception:
+        return None
+
+
+def _week_iso_year(reference_date: date | None = None) -> int:
+    """ISO year used for target weeks: the year of reference_date (default today) + 7 days."""
     if reference_date is None:
         reference_date = date.today()
-    next_week_date = reference_date + timedelta(days=7)
-    iso_year, _, _ = next_week_date.isocalendar()
-    return [date.fromisocalendar(iso_year, target_week, d) for d in range(1, 8)]
+    return (reference_date + timedelta(days=7)).isocalendar()[0]
+
+
+@lru_cache(maxsize=32)
+def _iso_week_dates(iso_year: int, target_week: int) -> tuple[date, ...]:
+    """(Monday, ..., Sunday) of the ISO week. Cached; the tuple is shared between callers."""
+    return tuple(date.fromisocalendar(iso_year, target_week, d) for d in range(1, 8))
+
+
+@lru_cache(maxsize=32)
+def _week_headers(iso_year: int, target_week: int) -> tuple[str, ...]:
+    """Day labels 'Måndag 13 oktober', ... for Monday..Sunday of the ISO week."""
+    return tuple(
+        f"{_WEEKDAY_SV[d.weekday()]} {d.day} {_MONTH_SV[d.month - 1]}"
+        for d in _iso_week_dates(iso_year, target_week)
+    )
 
 
 def _events_by_day_and_person(
     events_by_person: list[tuple[str, list[CalendarEvent]]],
-) -> dict[date, dict[str, list[CalendarEvent]]]:
-    """Group events by (day, person). Day is in CALENDAR_TIMEZONE."""
-    try:
-        tz = ZoneInfo(config.CALENDAR_TIMEZONE)
-    except Exception:
-        tz = None  # fallback: use event's own tz for date
-    by_day: dict[date, dict[str, list[CalendarEvent]]] = defaultdict(lambda: defaultdict(list))
+) -> dict[date, dict[str, list[tuple[datetime, CalendarEvent]]]]:
+    """
+    Group events by (day, person). Day is in CALENDAR_TIMEZONE.
+    Each event is stored as (local_start, event) so formatting doesn't convert the start again.
+    """
+    tz = _get_tz(config.CALENDAR_TIMEZONE)  # None: fallback to event's own tz for date
+    # Flat (day, person) -> events while grouping; nested into day -> person -> events at the end.
+    by_day_person: dict[tuple[date, str], list[tuple[datetime, CalendarEvent]]] = defaultdict(list)
     for person_name, events in events_by_person:
         name = person_name or "Övrigt"
         for e in events:
-            if tz is not None and e.start.tzinfo is not None:
+            start_tz = e.start.tzinfo
+            if tz is None or start_tz is tz:
+                local_start = e.start  # no calendar tz, or already in it (TZID feeds share the ZoneInfo)
+            elif start_tz is not None:
                 local_start = e.start.astimezone(tz)
-            elif tz is not None:
-                local_start = e.start.replace(tzinfo=tz)
             else:
-                local_start = e.start
-            day = local_start.date()
-            by_day[day][name].append(e)
-    for day in by_day:
-        for name in by_day[day]:
-            by_day[day][name].sort(key=lambda x: x.start)
-    return dict(by_day)
+                local_start = e.start.replace(tzinfo=tz)
+            by_day_person[(local_start.date(), name)].append((local_start, e))
+    by_day: dict[date, dict[str, list[tuple[datetime, CalendarEvent]]]] = {}
+    for (day, name), day_events in by_day_person.items():
+        day_events.sort(key=lambda x: x[1].start)
+        by_day.setdefault(day, {})[name] = day_events
+    return by_day
 
 
 def _dedupe_events_same_day(
-    events: list[CalendarEvent],
-    tz: ZoneInfo | None,
-) -> list[CalendarEvent]:
-    """Keep one event per (summary, location) per list; prefer timed over all-day (midnight)."""
+    events: list[tuple[datetime, CalendarEvent]],
+) -> list[tuple[datetime, CalendarEvent]]:
+    """
+    Keep one event per (summary, location) per list of (local_start, event); prefer timed over
+    all-day (midnight).
+    """
     if not events or len(events) <= 1:
         return events
-    key_to_events: dict[tuple[str, str], list[CalendarEvent]] = defaultdict(list)
-    for e in events:
+    key_to_events: dict[tuple[str, str], list[tuple[datetime, CalendarEvent]]] = defaultdict(list)
+    for local, e in events:
         loc = (e.location or "").strip()
-        key_to_events[(e.summary.strip(), loc)].append(e)
-    result: list[CalendarEvent] = []
+        key_to_events[(e.summary.strip(), loc)].append((local, e))
+    result: list[tuple[datetime, CalendarEvent]] = []
     for key, group in key_to_events.items():
-        def is_all_day(ev: CalendarEvent) -> bool:
-            if tz is not None and ev.start.tzinfo is not None:
-                local = ev.start.astimezone(tz)
-            else:
-                local = ev.start
-            return local.hour == 0 and local.minute == 0
         # Prefer timed event over all-day (midnight)
-        group_sorted = sorted(group, key=is_all_day)
+        group_sorted = sorted(group, key=lambda x: x[0].hour == 0 and x[0].minute == 0)
         result.append(group_sorted[0])
-    result.sort(key=lambda x: x.start)
+    result.sort(key=lambda x: x[1].start)
     return result
 
 
-def _format_event_short(e: CalendarEvent, tz: ZoneInfo | None) -> str:
-    """One event as 'HH:MM – Summary (location)' or 'Heldag – Summary'."""
-    if tz is not None and e.start.tzinfo is not None:
-        local = e.start.astimezone(tz)
-    else:
-        local = e.start
-    if local.hour == 0 and local.minute == 0:
+def _format_event_short(local_start: datetime, e: CalendarEvent) -> str:
+    """One event as 'HH:MM – Summary (location)' or 'Heldag – Summary'. local_start is in CALENDAR_TIMEZONE."""
+    if local_start.hour == 0 and local_start.minute == 0:
         time_str = "Heldag"
     else:
-        time_str = local.strftime("%H:%M")
+        time_str = local_start.strftime("%H:%M")
     part = f"{time_str} – {e.summary}"
     if e.location:
         part += f" ({e.location})"
@@ -109,6 +128,11 @@ def _school_heading_from_info(info: SchoolInfo) -> str:
     return info.person_name
 
 
+def _school_headings(school_infos: list[SchoolInfo]) -> list[str]:
+    """Headings for each school info, in order (computed once and shared by the formatters)."""
+    return [_school_heading_from_info(info) for info in school_infos]
+
+
 def _school_heading_from_name_class(person_name: str, class_label: str | None) -> str:
     """Display heading for one person (Name or Name (ClassLabel))."""
     if class_label:
@@ -121,8 +145,12 @@ def _serialize_calendar_for_llm(
     target_week: int,
     calendar_error: str | None = None,
     reference_date: date | None = None,
+    by_day: dict[date, dict[str, list[tuple[datetime, CalendarEvent]]]] | None = None,
 ) -> str:
-    """Serialize only the calendar section for the LLM (day-by-day, person/events)."""
+    """
+    Serialize only the calendar section for the LLM (day-by-day, person/events).
+    by_day: precomputed _events_by_day_and_person(events_by_person), if the caller already has it.
+    """
     lines: list[str] = []
     lines.append(f"KALENDER (vecka {target_week})")
     lines.append("---")
@@ -130,25 +158,23 @@ def _serialize_calendar_for_llm(
         lines.append(f"Kalenderfel: {calendar_error}")
         lines.append("")
     if events_by_person and target_week is not None:
-        try:
-            tz = ZoneInfo(config.CALENDAR_TIMEZONE) if config.CALENDAR_TIMEZONE else None
-        except Exception:
-            tz = None
-        week_dates = _week_dates(target_week, reference_date)
-        by_day = _events_by_day_and_person(events_by_person)
-        for d in week_dates:
-            weekday_sv = _WEEKDAY_SV[d.weekday()]
-            month_sv = _MONTH_SV[d.month - 1]
-            lines.append(f"{weekday_sv} {d.day} {month_sv}:")
+        iso_year = _week_iso_year(reference_date)
+        week_dates = _iso_week_dates(iso_year, target_week)
+        headers = _week_headers(iso_year, target_week)
+        if by_day is None:
+            by_day = _events_by_day_and_person(events_by_person)
+        for d, header in zip(week_dates, headers):
             persons_events = by_day.get(d, {})
             if not persons_events:
-                lines.append("  Inga händelser.")
+                body = ["  Inga händelser."]
             else:
-                for person_name in sorted(persons_events.keys()):
-                    deduped = _dedupe_events_same_day(persons_events[person_name], tz)
-                    event_strs = [_format_event_short(e, tz) for e in deduped]
-                    lines.append(f"  {person_name}: " + ". ".join(event_strs))
-            lines.append("")
+                body = [
+                    f"  {person_name}: " + ". ".join(
+                        _format_event_short(local, e) for local, e in _dedupe_events_same_day(events)
+                    )
+                    for person_name, events in sorted(persons_events.items())
+                ]
+            lines.extend((f"{header}:", *body, ""))
     else:
         lines.append("Inga kalenderhändelser.")
     lines.append("---")
@@ -161,18 +187,23 @@ def serialize_school_and_calendar_for_llm(
     target_week: int,
     calendar_error: str | None = None,
     reference_date: date | None = None,
+    by_day: dict[date, dict[str, list[tuple[datetime, CalendarEvent]]]] | None = None,
+    headings: list[str] | None = None,
 ) -> str:
     """
     Serialize school and calendar data into a single text block for the LLM.
     The LLM will use this to produce the final weekly overview (title, intro, ## Skola, ## Kalender).
+    by_day: optional precomputed _events_by_day_and_person(events_by_person), shared with build_digest.
+    headings: optional precomputed _school_headings(school_infos), also shared with build_digest.
     """
+    if headings is None:
+        headings = _school_headings(school_infos)
     lines: list[str] = []
     lines.append(f"VECKA: {target_week}")
     lines.append("")
     lines.append("SKOLA")
     lines.append("---")
-    for info in school_infos:
-        heading = _school_heading_from_info(info)
+    for info, heading in zip(school_infos, headings):
         if info.error:
             lines.append(f"{heading}: Fel – {info.error}")
         elif info.highlights:
@@ -185,7 +216,7 @@ def serialize_school_and_calendar_for_llm(
     lines.append("---")
     lines.append("")
     lines.append(_serialize_calendar_for_llm(
-        events_by_person, target_week, calendar_error, reference_date
+        events_by_person, target_week, calendar_error, reference_date, by_day
     ))
     return "\n".join(lines).strip()
 
@@ -200,15 +231,17 @@ def serialize_raw_school_and_calendar_for_llm(
     target_week: int,
     calendar_error: str | None = None,
     reference_date: date | None = None,
+    by_day: dict[date, dict[str, list[tuple[datetime, CalendarEvent]]]] | None = None,
 ) -> str:
     """
     Serialize raw school page text (per person) + calendar for a single LLM call.
     raw_blocks: list of (person_name, class_label, raw_text, error) per school page.
     Keeps total payload under _RAW_PAYLOAD_CAP; reserves space for calendar,
     splits the rest evenly across persons (truncating each raw_text if needed).
+    by_day: optional precomputed _events_by_day_and_person(events_by_person).
     """
     calendar_section = _serialize_calendar_for_llm(
-        events_by_person, target_week, calendar_error, reference_date
+        events_by_person, target_week, calendar_error, reference_date, by_day
     )
     header_lines = [f"VECKA: {target_week}", "", "SKOLA", "---"]
     header = "\n".join(header_lines) + "\n"
@@ -248,6 +281,8 @@ def build_digest(
     calendar_error: str | None = None,
     target_week: int | None = None,
     reference_date: date | None = None,
+    by_day: dict[date, dict[str, list[tuple[datetime, CalendarEvent]]]] | None = None,
+    headings: list[str] | None = None,
 ) -> str:
     """
     Build the full digest text (markdown-style for Discord).
@@ -255,7 +290,11 @@ def build_digest(
     events_by_person: list of (person_name, events). person_name "" = global calendar.
     If week_label is None, it is derived from the first school info that has a week number.
     target_week: if set, included as focus hint for LLM (filter school to this week).
+    by_day: optional precomputed _events_by_day_and_person(events_by_person) (e.g. from the LLM payload).
+    headings: optional precomputed _school_headings(school_infos).
     """
+    if headings is None:
+        headings = _school_headings(school_infos)
     # When we're filtering for a target week, use it in the title so title and focus match
     if target_week is not None:
         week_label = f"Vecka {target_week}"
@@ -280,7 +319,13 @@ def build_digest(
             familjen_events.extend(evs)
             break
     if familjen_events:
-        summaries = list(dict.fromkeys(e.summary.strip() for e in familjen_events if (e.summary or "").strip()))
+        # Unique non-empty summaries in order, stripping each summary once
+        seen: dict[str, None] = {}
+        for e in familjen_events:
+            summary = (e.summary or "").strip()
+            if summary and summary not in seen:
+                seen[summary] = None
+        summaries = list(seen)
         if len(summaries) == 1:
             parts.append(f"**Tillsammans:** Denna vecka har familjen tillsammans: {summaries[0]}.")
         elif summaries:
@@ -292,8 +337,7 @@ def build_digest(
     # School section
     parts.append("## Skola")
     any_school_error = False
-    for info in school_infos:
-        heading = _school_heading_from_info(info)
+    for info, heading in zip(school_infos, headings):
         if info.error:
             parts.append(f"**{heading}:** Kunde inte hämta sidan – {info.error}")
             any_school_error = True
@@ -314,30 +358,27 @@ def build_digest(
         parts.append("")
 
     # Calendar section: day-by-day when target_week is set, else flat per-person
-    try:
-        tz = ZoneInfo(config.CALENDAR_TIMEZONE) if config.CALENDAR_TIMEZONE else None
-    except Exception:
-        tz = None
-
     parts.append("## Kalender" + (f" (vecka {target_week})" if target_week is not None else ""))
     if calendar_error:
         parts.append(f"*Kunde inte hämta kalender: {calendar_error}*")
     elif events_by_person and target_week is not None:
-        week_dates = _week_dates(target_week, reference_date)
-        by_day = _events_by_day_and_person(events_by_person)
-        for d in week_dates:
-            weekday_sv = _WEEKDAY_SV[d.weekday()]
-            month_sv = _MONTH_SV[d.month - 1]
-            parts.append(f"### {weekday_sv} {d.day} {month_sv}")
+        iso_year = _week_iso_year(reference_date)
+        week_dates = _iso_week_dates(iso_year, target_week)
+        headers = _week_headers(iso_year, target_week)
+        if by_day is None:
+            by_day = _events_by_day_and_person(events_by_person)
+        for d, header in zip(week_dates, headers):
             persons_events = by_day.get(d, {})
             if not persons_events:
-                parts.append("Inga händelser.")
+                body = ["Inga händelser."]
             else:
-                for person_name in sorted(persons_events.keys()):
-                    deduped = _dedupe_events_same_day(persons_events[person_name], tz)
-                    event_strs = [_format_event_short(e, tz) for e in deduped]
-                    parts.append(f"**{person_name}:** " + ". ".join(event_strs))
-            parts.append("")
+                body = [
+                    f"**{person_name}:** " + ". ".join(
+                        _format_event_short(local, e) for local, e in _dedupe_events_same_day(events)
+                    )
+                    for person_name, events in sorted(persons_events.items())
+                ]
+            parts.extend((f"### {header}", *body, ""))
     elif events_by_person:
         for person_name, events in events_by_person:
             subheading = person_name if person_name else "Övrigt"
@@ -1,10 +1,66 @@
 """Send the digest to Discord via webhook."""
 
+import time
+
 import httpx
 
 import config
 
 
+# Discord allows up to 2000 characters per message; the first message also carries the mention.
+_MAX_MESSAGE_LEN = 2000
+_MENTION_PREFIX = "@here\n\n"
+# Retries per message when Discord answers 429 (rate limited)
+_RATE_LIMIT_RETRIES = 3
+
+
+def _split_message(content: str, max_len: int = _MAX_MESSAGE_LEN, first_prefix: str = "") -> list[str]:
+    """
+    Split content into chunks of at most max_len characters (the first one leaves room for first_prefix).
+    Sections (separated by blank lines) are stripped and empty ones dropped, then the text is packed
+    line by line in a single pass; a line longer than a whole message is hard-split.
+    """
+    text = "\n\n".join(p.strip() for p in content.split("\n\n") if p.strip())
+    chunks: list[str] = []
+    buf: list[str] = []
+    blen = 0
+    limit = max_len - len(first_prefix)
+    piece_len = limit
+    for line in text.split("\n"):
+        for start in range(0, max(len(line), 1), piece_len):
+            piece = line[start:start + piece_len]
+            needed = len(piece) + 1 if buf else len(piece)
+            if buf and blen + needed > limit:
+                chunks.append("\n".join(buf).rstrip("\n"))
+                buf, blen, limit = [], 0, max_len
+                needed = len(piece)
+            if not buf and not piece:
+                continue  # don't start a chunk with a blank line
+            buf.append(piece)
+            blen += needed
+    if buf:
+        chunks.append("\n".join(buf).rstrip("\n"))
+    return chunks
+
+
+def _retry_after_seconds(resp: httpx.Response) -> float:
+    """Seconds to wait after a 429, from the Retry-After header or Discord's JSON retry_after."""
+    try:
+        return float(resp.headers.get("Retry-After") or resp.json().get("retry_after") or 1.0)
+    except Exception:
+        return 1.0
+
+
+def _post_chunk(client: httpx.Client, payload: dict) -> None:
+    """Post one message, backing off and retrying while Discord rate-limits the webhook."""
+    for attempt in range(_RATE_LIMIT_RETRIES + 1):
+        resp = client.post(config.DISCORD_WEBHOOK_URL, json=payload)
+        if resp.status_code != 429 or attempt == _RATE_LIMIT_RETRIES:
+            break
+        time.sleep(min(_retry_after_seconds(resp), 30.0))
+    resp.raise_for_status()
+
+
 def send_digest(content: str) -> None:
     """
     Post the digest text to the configured Discord webhook.
@@ -15,52 +71,16 @@ def send_digest(content: str) -> None:
     if not config.DISCORD_WEBHOOK_URL:
         raise ValueError("DISCORD_WEBHOOK_URL is not set (check .env or environment)")
 
-    max_len = 2000
-    # Split by double newline first to avoid breaking mid-section, then by length
-    chunks: list[str] = []
-    current = []
-    current_len = 0
-
-    for part in content.split("\n\n"):
-        part = part.strip()
-        if not part:
-            continue
-        # If adding this part would exceed limit, flush current and start new chunk
-        if current_len + len(part) + 2 > max_len and current:
-            chunks.append("\n\n".join(current))
-            current = []
-            current_len = 0
-        # If single part is too long, split by newlines
-        if len(part) > max_len:
-            if current:
-                chunks.append("\n\n".join(current))
-                current = []
-                current_len = 0
-            for line in part.split("\n"):
-                if current_len + len(line) + 1 > max_len and current:
-                    chunks.append("\n".join(current))
-                    current = []
-                    current_len = 0
-                current.append(line)
-                current_len += len(line) + 1
-            continue
-        current.append(part)
-        current_len += len(part) + 2
-
-    if current:
-        chunks.append("\n\n".join(current))
-
+    chunks = _split_message(content, first_prefix=_MENTION_PREFIX)
     if chunks:
-        chunks[0] = "@here\n\n" + chunks[0]
-
-    for chunk in chunks:
-        payload = {
-            "content": chunk,
-            "allowed_mentions": {"parse": ["everyone"]},
-        }
-        resp = httpx.post(
-            config.DISCORD_WEBHOOK_URL,
-            json=payload,
-            timeout=10.0,
-        )
-        resp.raise_for_status()
+        chunks[0] = _MENTION_PREFIX + chunks[0]
+
+    # One client for all chunks: the connection (and TLS session) is reused between messages.
+    # Chunks are posted in order (not concurrently) so the digest reads top to bottom in the channel.
+    with httpx.Client(http2=True, timeout=10.0) as client:
+        for chunk in chunks:
+            payload = {
+                "content": chunk,
+                "allowed_mentions": {"parse": ["everyone"]},
+            }
+            _post_chunk(client, payload)
@@ -0,0 +1,48 @@
+"""On-disk per-URL cache for conditional GETs (ETag/Last-Modified), shared by cal_fetcher and school."""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from typing import Any, Callable
+
+import config
+
+
+def cache_path(kind: str, url: str, suffix: str) -> Path:
+    """Cache file for url under CACHE_DIR/kind (named by the URL's SHA-256, plus suffix)."""
+    name = hashlib.sha256(url.encode("utf-8")).hexdigest() + suffix
+    return Path(config.CACHE_DIR) / kind / name
+
+
+def read_entry(path: Path, loads: Callable[[bytes], Any]) -> dict[str, Any] | None:
+    """Entry stored at path (decoded with loads), or None if missing, unreadable or not a dict."""
+    try:
+        entry = loads(path.read_bytes())
+    except Exception:
+        return None
+    return entry if isinstance(entry, dict) else None
+
+
+def write_entry(path: Path, entry: dict[str, Any], dumps: Callable[[dict[str, Any]], bytes]) -> None:
+    """
+    Write entry to path (encoded with dumps). Failures are ignored, including values dumps can't
+    encode: the cache is only an optimization and must never cost the caller its result.
+    """
+    try:
+        data = dumps(entry)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+    except Exception:
+        pass
+
+
+def conditional_headers(entry: dict[str, Any] | None) -> dict[str, str]:
+    """If-None-Match / If-Modified-Since headers for a cached entry."""
+    headers: dict[str, str] = {}
+    if entry:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
@@ -11,9 +11,19 @@ Without OPENAI_API_KEY, run_weekly uses build_digest() (no LLM).
 
 from __future__ import annotations
 
+import hashlib
+import json
 import os
 import re
 import sys
+import time
+from functools import lru_cache
+from pathlib import Path
+
+# A highlight line already in digest format: **Subject:** ...
+_BOLD_PREFIX = re.compile(r"^\*\*[^*]+\*\*:")
+# Cached LLM responses not used for this long (seconds) are deleted when a new response is cached
+_LLM_CACHE_MAX_AGE = 14 * 24 * 60 * 60
 
 
 def _openai_client():
@@ -21,6 +31,12 @@ def _openai_client():
     api_key = os.environ.get("OPENAI_API_KEY", "").strip()
     if not api_key:
         return None
+    return _openai_client_for_key(api_key)
+
+
+@lru_cache(maxsize=1)
+def _openai_client_for_key(api_key: str):
+    """One OpenAI client per API key, so all calls in a run share its connection pool."""
     try:
         import openai
         return openai.OpenAI(api_key=api_key)
@@ -32,6 +48,61 @@ def _openai_client():
         return None
 
 
+def _llm_cache_path(model: str, messages: list[dict], max_completion_tokens: int) -> Path | None:
+    """Cache file for this exact request, or None if LLM_CACHE is off."""
+    import config
+
+    if not config.LLM_CACHE:
+        return None
+    key = json.dumps([model, messages, max_completion_tokens], ensure_ascii=False, sort_keys=True)
+    name = hashlib.sha256(key.encode("utf-8")).hexdigest() + ".txt"
+    return Path(config.CACHE_DIR) / "llm" / name
+
+
+def _prune_llm_cache(cache_dir: Path) -> None:
+    """Delete cached responses last used more than _LLM_CACHE_MAX_AGE ago. Failures are ignored."""
+    cutoff = time.time() - _LLM_CACHE_MAX_AGE
+    try:
+        for path in cache_dir.glob("*.txt"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError:
+                pass
+    except OSError:
+        pass
+
+
+def _chat_completion(client, model: str, messages: list[dict], max_completion_tokens: int) -> str:
+    """
+    Response text for a chat completion (stripped). Identical requests are answered from the on-disk
+    cache without calling the API; only non-empty responses are cached. A hit refreshes the entry's
+    mtime, so entries still in use survive pruning. API errors propagate.
+    """
+    path = _llm_cache_path(model, messages, max_completion_tokens)
+    if path is not None:
+        try:
+            text = path.read_text(encoding="utf-8")
+            path.touch()
+            return text
+        except OSError:
+            pass
+    resp = client.chat.completions.create(
+        model=model,
+        messages=messages,
+        max_completion_tokens=max_completion_tokens,
+    )
+    text = (resp.choices[0].message.content or "").strip()
+    if path is not None and text:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            _prune_llm_cache(path.parent)
+            path.write_text(text, encoding="utf-8")
+        except OSError:
+            pass
+    return text
+
+
 def extract_school_highlights(
     raw_page_text: str,
     person_name: str,
@@ -64,15 +135,15 @@ Format: exakt en rad per post, i formen **Ämne:** beskrivning. T.ex. **Svenska:
 Skriv inga rubriker eller förklaringar, bara raderna. """
 
     try:
-        resp = client.chat.completions.create(
-            model=model,
-            messages=[
+        text = _chat_completion(
+            client,
+            model,
+            [
                 {"role": "system", "content": system},
                 {"role": "user", "content": raw_page_text[:30000]},  # cap tokens
             ],
-            max_completion_tokens=2048,
+            2048,
         )
-        text = (resp.choices[0].message.content or "").strip()
         if not text or text.upper().strip() == "INGEN":
             return []
         # Parse lines: expect **Subject:** rest
@@ -82,7 +153,7 @@ Skriv inga rubriker eller förklaringar, bara raderna. """
             if not line:
                 continue
             # Normalize to our format if the model wrote "Subject:" without **
-            if re.match(r"^\*\*[^*]+\*\*:", line):
+            if _BOLD_PREFIX.match(line):
                 lines.append(line)
             elif ":" in line and not line.startswith("#"):
                 # e.g. "Svenska: v7-11 ..." -> **Svenska:** v7-11 ...
@@ -118,15 +189,15 @@ def get_new_school_items_only(
 Nu har skolsidan uppdaterats. Din uppgift: Läs den aktuella sidtexten och lista ENDAST de poster som är NYA eller ÄNDRADE (som inte fanns i listan ovan) och som gäller vecka {target_week} (eller prov även senare). Samma format: en rad per post, **Ämne:** beskrivning. Markera prov med **PROV**. Om inget nytt eller ändrat finns, skriv exakt INGET."""
     user = f"Aktuell sidtext för {person_name}:\n\n{raw_cap}"
     try:
-        resp = client.chat.completions.create(
-            model=model,
-            messages=[
+        text = _chat_completion(
+            client,
+            model,
+            [
                 {"role": "system", "content": system},
                 {"role": "user", "content": user},
             ],
-            max_completion_tokens=1024,
+            1024,
         )
-        text = (resp.choices[0].message.content or "").strip()
         if not text or text.upper().strip() == "INGET":
             return []
         lines = []
@@ -134,7 +205,7 @@ Nu har skolsidan uppdaterats. Din uppgift: Läs den aktuella sidtexten och lista
             line = line.strip().strip("- ")
             if not line:
                 continue
-            if re.match(r"^\*\*[^*]+\*\*:", line):
+            if _BOLD_PREFIX.match(line):
                 lines.append(line)
             elif ":" in line and not line.startswith("#"):
                 sub, _, rest = line.partition(":")
@@ -159,7 +230,12 @@ def create_weekly_overview(
     If OPENAI_API_KEY is not set or the LLM fails, falls back to build_digest() (no LLM).
     reference_date: used to resolve ISO year for target_week (default: today).
     """
-    from digest import build_digest, serialize_school_and_calendar_for_llm
+    from digest import (
+        _events_by_day_and_person,
+        _school_headings,
+        build_digest,
+        serialize_school_and_calendar_for_llm,
+    )
 
     client = _openai_client()
     if not client:
@@ -171,12 +247,17 @@ def create_weekly_overview(
             reference_date=reference_date,
         )
 
+    # Group events by day and build school headings once; the payload and the fallback digest share them.
+    by_day = _events_by_day_and_person(events_by_person) if events_by_person else None
+    headings = _school_headings(school_infos)
     payload = serialize_school_and_calendar_for_llm(
         school_infos,
         events_by_person,
         target_week,
         calendar_error=calendar_error,
         reference_date=reference_date,
+        by_day=by_day,
+        headings=headings,
     )
     model = (os.environ.get("OPENAI_DIGEST_MODEL") or "gpt-4o-mini").strip()
     if not model:
@@ -204,15 +285,15 @@ Uppgift: Skriv den färdiga veckosammanfattningen på svenska i följande format
 
 
     try:
-        resp = client.chat.completions.create(
-            model=model,
-            messages=[
+        text = _chat_completion(
+            client,
+            model,
+            [
                 {"role": "system", "content": system},
                 {"role": "user", "content": payload[:30000]},
             ],
-            max_completion_tokens=4096,
+            4096,
         )
-        text = (resp.choices[0].message.content or "").strip()
         if text:
             return text
     except Exception as e:
@@ -223,6 +304,8 @@ Uppgift: Skriv den färdiga veckosammanfattningen på svenska i följande format
         calendar_error=calendar_error,
         target_week=target_week,
         reference_date=reference_date,
+        by_day=by_day,
+        headings=headings,
     )
 
 
@@ -238,8 +321,7 @@ def create_weekly_overview_from_raw(
     raw_blocks: list of (person_name, class_label, raw_text, error) per school page.
     On API failure, falls back to build_digest with synthetic school_infos (highlights=[], error set).
     """
-    from digest import build_digest, serialize_raw_school_and_calendar_for_llm
-    from school import SchoolInfo
+    from digest import _events_by_day_and_person, build_digest, serialize_raw_school_and_calendar_for_llm
 
     client = _openai_client()
     if not client:
@@ -254,12 +336,15 @@ def create_weekly_overview_from_raw(
             reference_date=reference_date,
         )
 
+    # Payload is built only once a client exists; the day grouping is shared with the fallback digest.
+    by_day = _events_by_day_and_person(events_by_person) if events_by_person else None
     payload = serialize_raw_school_and_calendar_for_llm(
         raw_blocks,
         events_by_person,
         target_week,
         calendar_error=calendar_error,
         reference_date=reference_date,
+        by_day=by_day,
     )
     model = (os.environ.get("OPENAI_DIGEST_MODEL") or "gpt-4o-mini").strip() or "gpt-4o-mini"
     print(f"Using model: {model}", file=sys.stderr)
@@ -279,15 +364,15 @@ Utdataformat:
 Skriv på svenska."""
 
     try:
-        resp = client.chat.completions.create(
-            model=model,
-            messages=[
+        text = _chat_completion(
+            client,
+            model,
+            [
                 {"role": "system", "content": system},
                 {"role": "user", "content": payload[:30000]},
             ],
-            max_completion_tokens=4096,
+            4096,
         )
-        text = (resp.choices[0].message.content or "").strip()
         if text:
             return text
     except Exception as e:
@@ -299,6 +384,7 @@ Skriv på svenska."""
         calendar_error=calendar_error,
         target_week=target_week,
         reference_date=reference_date,
+        by_day=by_day,
     )
 
 
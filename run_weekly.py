@@ -26,7 +26,9 @@ Check-updates dry-run (see what would be sent without sending or updating snapsh
 import argparse
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
+from functools import lru_cache
 from pathlib import Path
 
 import config
@@ -52,18 +54,23 @@ from snapshot import (
 DEFAULT_PREVIEW_FILE = "digest_preview.txt"
 
 
+@lru_cache(maxsize=8)
+def _week_info(day: date) -> tuple[int, int, date]:
+    """(iso_year, iso_week, monday_of_week) for the week containing day."""
+    iso_year, week, _ = day.isocalendar()
+    return iso_year, week, date.fromisocalendar(iso_year, week, 1)
+
+
 def _next_week_number() -> int:
     """ISO week number for the week after today."""
-    next_week_date = date.today() + timedelta(days=7)
-    return next_week_date.isocalendar().week
+    return _week_info(date.today() + timedelta(days=7))[1]
 
 
 def _default_target_week_and_reference() -> tuple[int, date]:
     """Default target week and reference_date by weekday. Mon–Fri → current week; Sat–Sun → next week."""
     today = date.today()
     if today.weekday() <= 4:  # Monday=0 .. Friday=4
-        iso_year, target_week, _ = today.isocalendar()
-        monday_of_week = date.fromisocalendar(iso_year, target_week, 1)
+        _iso_year, target_week, monday_of_week = _week_info(today)
         reference_date = monday_of_week - timedelta(days=7)
         return target_week, reference_date
     # Saturday=5, Sunday=6 → next week
@@ -71,6 +78,33 @@ def _default_target_week_and_reference() -> tuple[int, date]:
     return target_week, today
 
 
+def _fetch_school_and_calendar(
+    target_week: int, reference_date: date
+) -> tuple[list | None, list | None, list[tuple[str, list]], str | None]:
+    """
+    Fetch school pages and calendar events concurrently (independent network work).
+    Returns (school_infos, raw_blocks, events_by_person, calendar_error). With USE_LLM_EXTRACTION,
+    raw_blocks is set and school_infos is None; otherwise the reverse. A calendar failure gives
+    no events and its message as calendar_error.
+    """
+    def fetch_school():
+        if config.USE_LLM_EXTRACTION:
+            return None, [
+                (person_name, class_label, raw_text, err)
+                for person_name, class_label, _url, raw_text, err in fetch_all_raw_school_texts()
+            ]
+        return fetch_all_school_info(target_week=target_week), None
+
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        school_fut = ex.submit(fetch_school)
+        cal_fut = ex.submit(fetch_events_for_week, target_week, reference_date=reference_date)
+        school_infos, raw_blocks = school_fut.result()
+        try:
+            return school_infos, raw_blocks, cal_fut.result(), None
+        except Exception as e:
+            return school_infos, raw_blocks, [], str(e)
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(
         description="Run weekly digest (send to Discord or write to file for review)."
@@ -117,24 +151,13 @@ def main() -> int:
 
     # Weekday check-updates path: current week only, diff and notify
     if args.check_updates:
-        today = date.today()
-        iso_year, target_week, _ = today.isocalendar()
-        monday_of_week = date.fromisocalendar(iso_year, target_week, 1)
+        iso_year, target_week, monday_of_week = _week_info(date.today())
         reference_date = monday_of_week - timedelta(days=7)
-        if config.USE_LLM_EXTRACTION:
-            raw_blocks = [
-                (pn, cl, raw_text, err)
-                for pn, cl, _url, raw_text, err in fetch_all_raw_school_texts()
-            ]
-            school_infos = None
-        else:
-            school_infos = fetch_all_school_info(target_week=target_week)
-            raw_blocks = None
-        try:
-            events_by_person = fetch_events_for_week(target_week, reference_date=reference_date)
-        except Exception as e:
-            print(f"Calendar fetch failed: {e}", file=sys.stderr)
-            events_by_person = []
+        school_infos, raw_blocks, events_by_person, calendar_error = _fetch_school_and_calendar(
+            target_week, reference_date
+        )
+        if calendar_error is not None:
+            print(f"Calendar fetch failed: {calendar_error}", file=sys.stderr)
         current = build_snapshot(
             school_infos,
             raw_blocks,
@@ -163,12 +186,20 @@ def main() -> int:
                         school_updates[p] = new_lines
             elif "school_digest_highlights" in stored and raw_blocks is not None:
                 person_to_raw = {pn: (raw or "") for (pn, _, raw, _) in raw_blocks}
-                for p in school_changed:
-                    previous = stored["school_digest_highlights"].get(p) or []
-                    raw_text = person_to_raw.get(p) or ""
-                    new_lines = get_new_school_items_only(p, previous, raw_text, target_week)
-                    if new_lines:
-                        school_updates[p] = new_lines
+                # One LLM call per changed person; run them concurrently (results kept in person order)
+                with ThreadPoolExecutor(max_workers=min(len(school_changed), 8)) as ex:
+                    results = ex.map(
+                        lambda p: get_new_school_items_only(
+                            p,
+                            stored["school_digest_highlights"].get(p) or [],
+                            person_to_raw.get(p) or "",
+                            target_week,
+                        ),
+                        school_changed,
+                    )
+                    for p, new_lines in zip(school_changed, results):
+                        if new_lines:
+                            school_updates[p] = new_lines
         msg = format_notification(
             target_week, iso_year, school_changed, new_events, school_updates=school_updates or None
         )
@@ -196,7 +227,7 @@ def main() -> int:
 
     if args.week is not None:
         target_week = args.week
-        year = args.year if args.year is not None else date.today().isocalendar()[0]
+        year = args.year if args.year is not None else _week_info(date.today())[0]
         # reference_date so that (reference_date + 7) falls in target_week of year
         monday_of_week = date.fromisocalendar(year, target_week, 1)
         reference_date = monday_of_week - timedelta(days=7)
@@ -204,25 +235,13 @@ def main() -> int:
         # Mon–Fri → current week; Sat–Sun → next week
         target_week, reference_date = _default_target_week_and_reference()
 
-    if config.USE_LLM_EXTRACTION:
-        raw_blocks = [
-            (person_name, class_label, raw_text, err)
-            for person_name, class_label, _url, raw_text, err in fetch_all_raw_school_texts()
-        ]
-        school_infos = None
-    else:
-        school_infos = fetch_all_school_info(target_week=target_week)
-        raw_blocks = None
-
-    events_by_person: list[tuple[str, list]] = []
-    calendar_error = None
-    try:
-        events_by_person = fetch_events_for_week(target_week, reference_date=reference_date)
-    except Exception as e:
-        calendar_error = str(e)
+    school_infos, raw_blocks, events_by_person, calendar_error = _fetch_school_and_calendar(
+        target_week, reference_date
+    )
 
+    iso_year = (reference_date + timedelta(days=7)).isocalendar()[0]
+    has_openai_key = bool(os.environ.get("OPENAI_API_KEY", "").strip())
     if config.USE_LLM_EXTRACTION:
-        has_openai_key = bool(os.environ.get("OPENAI_API_KEY", "").strip())
         if has_openai_key:
             body = create_weekly_overview_from_raw(
                 raw_blocks,
@@ -241,7 +260,7 @@ def main() -> int:
                 target_week=target_week,
                 reference_date=reference_date,
             )
-    elif os.environ.get("OPENAI_API_KEY", "").strip():
+    elif has_openai_key:
         body = create_weekly_overview(
             school_infos,
             events_by_person,
@@ -259,7 +278,6 @@ def main() -> int:
         )
 
     if args.save_snapshot:
-        iso_year = (reference_date + timedelta(days=7)).isocalendar()[0]
         snapshot = build_snapshot(
             school_infos,
             raw_blocks,
@@ -275,8 +293,7 @@ def main() -> int:
     if args.dry_run:
         out_path = Path(args.output)
         out_path.write_text(body, encoding="utf-8")
-        week_year = (reference_date + timedelta(days=7)).isocalendar()[0]
-        print(f"Target week: {target_week} (year {week_year})", file=sys.stderr)
+        print(f"Target week: {target_week} (year {iso_year})", file=sys.stderr)
         print(f"Preview written to: {out_path.absolute()}", file=sys.stderr)
         print("(Not sent to Discord. Adjust filtering in school.py / llm_improve.py and run again.)", file=sys.stderr)
         return 0
@@ -289,7 +306,6 @@ def main() -> int:
     try:
         send_digest(body)
         print("Digest sent to Discord.")
-        iso_year = (reference_date + timedelta(days=7)).isocalendar()[0]
         snapshot = build_snapshot(
             school_infos,
             raw_blocks,
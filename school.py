@@ -1,13 +1,33 @@
 """Fetch and parse school class pages for weekly highlights."""
 
+import asyncio
+import hashlib
+import json
 import re
+import time
+from itertools import accumulate
 from dataclasses import dataclass
-from typing import Optional
+from pathlib import Path
+from typing import Any, Optional, Union
 
 import httpx
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, UnicodeDammit
 
 import config
+import http_cache
+
+# libxml2-backed parser (lxml is in requirements.txt); stdlib parser if lxml cannot be installed.
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = "lxml"
+except ImportError:
+    _HTML_PARSER = "html.parser"
+
+# Much faster text extraction for the raw (LLM) path when selectolax is installed; BeautifulSoup otherwise.
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
 
 # Subject headers we split on (order matters for splitting)
 SUBJECT_HEADERS = [
@@ -25,6 +45,14 @@ SUBJECT_HEADERS = [
     "Tyska",
     "Español",
 ]
+# All subject headers in one pass; group i+1 matches _SUBJECT_RE_HEADERS[i]. Longest first, so a
+# header that extends another (e.g. "Idrott och hälsa" vs a plain "Idrott") wins at the same position.
+# Word boundary so "NO" doesn't match inside "diagnos".
+_SUBJECT_RE_HEADERS = tuple(sorted(SUBJECT_HEADERS, key=len, reverse=True))
+SUBJECT_RE = re.compile(
+    "|".join(r"\b(" + re.escape(h) + r")\s*:?\s*" for h in _SUBJECT_RE_HEADERS),
+    re.IGNORECASE,
+)
 
 # Keywords that mark important items (prov, läxa, förhör, etc.)
 IMPORTANT_KEYWORDS = re.compile(
@@ -36,10 +64,15 @@ WEEK_REF = re.compile(
     r"\b(?:[vV]\.?\s*\d+|vecka\s*\d+|week\s*\d+)",
     re.IGNORECASE,
 )
+# Keyword or week reference in one search (used per line by _relevant_line)
+RELEVANT_RE = re.compile(IMPORTANT_KEYWORDS.pattern + "|" + WEEK_REF.pattern, re.IGNORECASE)
+# Page's own week heading: "Vecka 6" / "Vecka6"
+_WEEK_LINE_EXTRACT = re.compile(r"Vecka\s*(\d+)", re.IGNORECASE)
 # Week range: v7-11, v.3 - 6, Week 3 - 8
 WEEK_RANGE = re.compile(r"(\d+)\s*-\s*(\d+)")
 # Extract week number from a week ref (e.g. "v. 6" -> 6)
 WEEK_NUM = re.compile(r"\d+")
+_HAS_DIGIT = re.compile(r"\d")
 
 # Lines with no week ref that are too generic (likely from past-week blocks) – skip
 GENERIC_NO_WEEK_PHRASES = frozenset(
@@ -51,6 +84,8 @@ GENERIC_NO_WEEK_PHRASES = frozenset(
         "Ingen läxa.",
     )
 )
+# Longer lines can't be a generic phrase, so they skip the set lookup (and hashing the line)
+_GENERIC_MAX_LEN = max(map(len, GENERIC_NO_WEEK_PHRASES))
 # Start of line that is generic Classroom promo (not week-specific)
 CLASSROOM_PROMO_PATTERN = re.compile(
     r"^[\s\-]*här finns planering för (kapitlet|kapitel)",
@@ -63,6 +98,24 @@ WEEK_RANGE_ONLY_LINE = re.compile(
 )
 MAX_FOLLOW_LINE_LEN = 220  # cap context for Engelska follow-line(s)
 MAX_FOLLOW_LINES = 5  # max lines of context after week-range line (then truncate)
+# Start of the next section after an Engelska week-range line (matched against the lowercased line):
+# "Classroom:" or a subject header followed by ":" (or " " when cutting the raw segment text)
+_HEADER_ALT_LOWER = "|".join(re.escape(h.lower()) for h in SUBJECT_HEADERS)
+_NEXT_SECTION_RE = re.compile(rf"classroom:|(?:{_HEADER_ALT_LOWER})[: ]")
+_NEXT_SECTION_COLON_RE = re.compile(rf"classroom:|(?:{_HEADER_ALT_LOWER}):")
+# Subjects where "ta med" / "dusch" / "ombyte" lines are kept even without keyword or week ref
+_PHYS_HEADERS = frozenset({"Idrott och hälsa", "Musik", "Bild"})
+
+# School pages are fetched concurrently over one pooled client (several classes often share a host).
+_HTTP_LIMITS = httpx.Limits(max_connections=16, max_keepalive_connections=16)
+# Cached page text without ETag/Last-Modified is reused without a request for this long (seconds)
+_PAGE_CACHE_MAX_AGE = 30 * 60
+# Struck-out (old/deprecated) content: strikethrough tags or an inline line-through style, in one pass
+_STRIKETHROUGH_SELECTOR = 's, strike, del, [style*="line-through" i]'
+# Stored with cached page text; bump when _page_text_from_response changes so old text is refetched
+_PAGE_TEXT_VERSION = 2
+# Part of the parsed-highlights cache key; bump when parsing/filtering changes so old entries are ignored
+_PARSED_CACHE_VERSION = 2
 
 
 @dataclass
@@ -77,39 +130,179 @@ class SchoolInfo:
     error: Optional[str] = None
 
 
-def _get_page_text(url: str, timeout: float = 15.0) -> str:
+def _get_page_text(url: str, timeout: float = 15.0, raw: bool = False) -> str:
     """Fetch URL and return main text content. Strikethrough content is removed."""
-    resp = httpx.get(url, follow_redirects=True, timeout=timeout)
+    text = _get_page_texts([url], timeout=timeout, raw=raw)[0]
+    if isinstance(text, Exception):
+        raise text
+    return text
+
+
+def _fast_text(raw: bool) -> bool:
+    """True if raw page text is extracted with selectolax (see _page_text_from_response_fast)."""
+    return raw and LexborHTMLParser is not None
+
+
+def _page_cache_path(url: str, raw: bool = False) -> Path:
+    """Cache file for a school page URL (text from the two extractors is cached separately)."""
+    return http_cache.cache_path("school_raw" if _fast_text(raw) else "school", url, ".json")
+
+
+def _json_bytes(entry: dict[str, Any]) -> bytes:
+    """Cache entry as UTF-8 JSON."""
+    return json.dumps(entry, ensure_ascii=False).encode("utf-8")
+
+
+def _page_cache_get(url: str, raw: bool = False) -> dict[str, Any] | None:
+    """
+    Cached entry for url (keys: etag, last_modified, text, fetched_at, version), or None if
+    missing/unreadable or extracted by an older _PAGE_TEXT_VERSION.
+    """
+    entry = http_cache.read_entry(_page_cache_path(url, raw), json.loads)
+    if entry is None or entry.get("version") != _PAGE_TEXT_VERSION:
+        return None
+    return entry if isinstance(entry.get("text"), str) else None
+
+
+def _page_cache_put(url: str, entry: dict[str, Any], raw: bool = False) -> None:
+    """Write cache entry for url. Failures are ignored (the cache is only an optimization)."""
+    http_cache.write_entry(_page_cache_path(url, raw), entry, _json_bytes)
+
+
+def _page_cache_fresh(entry: dict[str, Any] | None) -> bool:
+    """True if entry has no validators to revalidate with and is younger than _PAGE_CACHE_MAX_AGE."""
+    if not entry or entry.get("etag") or entry.get("last_modified"):
+        return False
+    try:
+        return time.time() - float(entry.get("fetched_at") or 0) < _PAGE_CACHE_MAX_AGE
+    except (TypeError, ValueError):
+        return False
+
+
+async def _fetch_page_texts(
+    urls: list[str],
+    entries: list[dict[str, Any] | None],
+    timeout: float = 15.0,
+    raw: bool = False,
+) -> list[Union[str, Exception]]:
+    """
+    Fetch all URLs concurrently over one client (conditional GETs against the cached entries).
+    Each page is parsed as soon as its response arrives, overlapping parsing with the remaining
+    downloads. A page that fails to download or parse maps to its exception.
+    """
+    async with httpx.AsyncClient(
+        follow_redirects=True, timeout=timeout, http2=True, limits=_HTTP_LIMITS
+    ) as client:
+
+        async def fetch(url: str, entry: dict[str, Any] | None) -> Union[str, Exception]:
+            try:
+                resp = await client.get(url, headers=http_cache.conditional_headers(entry))
+                return _page_text_for_response(url, resp, entry, raw)
+            except Exception as e:
+                return e
+
+        return await asyncio.gather(*(fetch(url, entry) for url, entry in zip(urls, entries)))
+
+
+def _page_text_for_response(
+    url: str, resp: httpx.Response, entry: dict[str, Any] | None, raw: bool = False
+) -> str:
+    """Page text for a fetched URL: cached text on 304, else parsed from the response (and cached)."""
+    if resp.status_code == 304 and entry:
+        return entry["text"]
+    text = _page_text_from_response_fast(resp) if _fast_text(raw) else _page_text_from_response(resp)
+    _page_cache_put(url, {
+        "etag": resp.headers.get("ETag"),
+        "last_modified": resp.headers.get("Last-Modified"),
+        "text": text,
+        "fetched_at": time.time(),
+        "version": _PAGE_TEXT_VERSION,
+    }, raw)
+    return text
+
+
+def _get_page_texts(
+    urls: list[str], timeout: float = 15.0, raw: bool = False
+) -> list[Union[str, Exception]]:
+    """
+    Page text for each URL. Pages are fetched concurrently with conditional GETs against the on-disk
+    cache (CACHE_DIR/school), and unchanged pages reuse the cached text without parsing.
+    raw: text for the LLM path, extracted with selectolax when it is installed (CACHE_DIR/school_raw).
+    A page that fails to download or parse maps to its exception.
+    """
+    entries = [_page_cache_get(url, raw) for url in urls]
+    results: list[Union[str, Exception]] = [""] * len(urls)
+    to_fetch = []
+    for i, entry in enumerate(entries):
+        if _page_cache_fresh(entry):
+            results[i] = entry["text"]
+        else:
+            to_fetch.append(i)
+    if to_fetch:
+        texts = asyncio.run(_fetch_page_texts(
+            [urls[i] for i in to_fetch], [entries[i] for i in to_fetch], timeout, raw
+        ))
+        for i, text in zip(to_fetch, texts):
+            results[i] = text
+    return results
+
+
+def _page_text_from_response(resp: httpx.Response) -> str:
+    """Main text content of a fetched page (raises for HTTP errors). Strikethrough content is removed."""
     resp.raise_for_status()
-    soup = BeautifulSoup(resp.text, "html.parser")
-    for tag in soup(["script", "style"]):
+    # Hand the raw bytes to the parser (no separate decoded copy of the page); a charset from the
+    # Content-Type header wins, otherwise the parser detects it (meta charset, UTF-8, ...).
+    soup = BeautifulSoup(resp.content, _HTML_PARSER, from_encoding=resp.charset_encoding)
+    # Site chrome (menus, sidebars, footers) never holds class info and can contain stray "vecka N"
+    for tag in soup(["script", "style", "nav", "aside", "footer"]):
         tag.decompose()
+    # Only the page's <main> content when it has one
+    root = soup.find("main") or soup
     # Remove strikethrough (old/deprecated) so it doesn't appear in highlights
-    for tag in soup.find_all(["s", "strike", "del"]):
-        tag.decompose()
-    for tag in soup.find_all(
-        lambda t: t.get("style") and "line-through" in (t.get("style") or "").lower()
-    ):
+    for tag in root.select(_STRIKETHROUGH_SELECTOR):
         tag.decompose()
-    return soup.get_text(separator="\n", strip=True)
+    return root.get_text(separator="\n", strip=True)
+
+
+def _page_text_from_response_fast(resp: httpx.Response) -> str:
+    """
+    Same as _page_text_from_response, parsed with selectolax (lexbor). Several times faster; text can
+    differ on malformed markup (HTML5 tree building), so it is only used for the raw (LLM) path.
+    """
+    resp.raise_for_status()
+    # Same charset detection as BeautifulSoup (header charset first, then meta charset / sniffing)
+    html = UnicodeDammit(
+        resp.content, [resp.charset_encoding] if resp.charset_encoding else [], is_html=True
+    ).unicode_markup
+    tree = LexborHTMLParser(html)
+    for node in tree.css("script, style, nav, aside, footer"):
+        node.decompose()
+    root = tree.css_first("main") or tree.root
+    for node in root.css(_STRIKETHROUGH_SELECTOR):
+        node.decompose()
+    parts = (node.text_content.strip() for node in root.traverse(include_text=True) if node.tag == "-text")
+    return "\n".join(p for p in parts if p)
 
 
 def _extract_week(text: str) -> Optional[int]:
     """Extract current week number from text (e.g. 'Vecka 6' or 'Vecka6')."""
-    m = re.search(r"Vecka\s*(\d+)", text, re.IGNORECASE)
+    m = _WEEK_LINE_EXTRACT.search(text)
     return int(m.group(1)) if m else None
 
 
 def _relevant_line(line: str) -> bool:
     """True if line contains something we want in the digest (prov, läxa, förhör, week ref)."""
     line = line.strip()
-    if not line or len(line) > 500:
+    # Shortest possible match is a two-character week ref ("v6")
+    if not 2 <= len(line) <= 500:
         return False
-    return bool(IMPORTANT_KEYWORDS.search(line) or WEEK_REF.search(line))
+    return RELEVANT_RE.search(line) is not None
 
 
 def _all_week_numbers_in_line(line: str) -> list[int]:
     """Extract all week numbers mentioned in a line (refs like v.6 and ranges like v7-11)."""
+    if not _HAS_DIGIT.search(line):
+        return []  # Both patterns need a digit; most lines have none
     numbers: set[int] = set()
     for m in WEEK_REF.finditer(line):
         num_match = WEEK_NUM.search(m.group(0))
@@ -121,16 +314,18 @@ def _all_week_numbers_in_line(line: str) -> list[int]:
     return sorted(numbers)
 
 
-def _is_generic_no_week_line(line: str) -> bool:
-    """True if line has no week ref and is a known generic phrase we should skip."""
-    if _all_week_numbers_in_line(line):
-        return False  # Has week ref – keep/week filter decides
-    normalized = " ".join(line.strip().lower().split())
-    if normalized in GENERIC_NO_WEEK_PHRASES:
-        return True
-    if CLASSROOM_PROMO_PATTERN.search(line):
-        return True
-    return False
+def _is_generic_no_week_line(line: str, line_lower: Optional[str] = None) -> bool:
+    """
+    True if line has no week ref and is a known generic phrase we should skip.
+    line_lower: line already whitespace-normalized and lowercased, if the caller has it.
+    """
+    normalized = line_lower if line_lower is not None else " ".join(line.strip().lower().split())
+    if len(normalized) <= _GENERIC_MAX_LEN and normalized in GENERIC_NO_WEEK_PHRASES:
+        return True  # The phrases contain no week refs
+    # Substring test first: the promo regex only needs to run on the rare lines that can match it
+    if "här finns planering för kapit" not in normalized or not CLASSROOM_PROMO_PATTERN.search(line):
+        return False
+    return not _all_week_numbers_in_line(line)  # Has week ref – keep/week filter decides
 
 
 def _line_applies_to_week(line: str, target_week: int) -> bool:
@@ -167,33 +362,35 @@ def _parse_page_text(text: str, url: str, person_name: str, class_label: Optiona
     week = _extract_week(text)
     highlights: list[str] = []
 
-    # Find all subject header positions (start index, header name).
-    # Use word boundary so "NO" doesn't match inside "diagnos".
-    positions: list[tuple[int, str]] = []
-    for header in SUBJECT_HEADERS:
-        pattern = re.compile(
-            r"\b" + re.escape(header) + r"\s*:?\s*",
-            re.IGNORECASE,
-        )
-        for m in pattern.finditer(text):
-            positions.append((m.start(), header))
-            break  # first occurrence per header
-    positions.sort(key=lambda x: x[0])
+    # Find all subject header positions (start index, header name), first occurrence per header
+    first_pos: dict[str, int] = {}
+    for m in SUBJECT_RE.finditer(text):
+        first_pos.setdefault(_SUBJECT_RE_HEADERS[m.lastindex - 1], m.start())
+    positions = sorted((start, header) for header, start in first_pos.items())
 
     for i, (start, header) in enumerate(positions):
         end = positions[i + 1][0] if i + 1 < len(positions) else len(text)
         segment = text[start:end]
         lines = segment.splitlines()
+        # Start offset of each line in segment (with its own line break, which may be \r\n), for the
+        # Engelska follow-line context
+        offsets = (
+            list(accumulate(map(len, segment.splitlines(keepends=True)), initial=0))
+            if header == "Engelska"
+            else None
+        )
+        header_lower = header.lower()
         skip_count = 0
         for idx, raw_line in enumerate(lines):
             if skip_count > 0:
                 skip_count -= 1
                 continue
             line = raw_line.strip().lstrip(":")
-            if not line or line.lower().startswith(header.lower()):
+            if not line or line.lower().startswith(header_lower):
                 continue
             line = " ".join(line.split())
-            if _is_generic_no_week_line(line):
+            line_lower = line.lower()
+            if _is_generic_no_week_line(line, line_lower):
                 continue
             if _relevant_line(line):
                 # For Engelska: if this is a short week-range line, add next line as context
@@ -202,21 +399,16 @@ def _parse_page_text(text: str, url: str, person_name: str, class_label: Optiona
                     and WEEK_RANGE_ONLY_LINE.match(line)
                     and idx + 1 < len(lines)
                 ):
-                    # Use raw segment text after this line (robust to HTML line breaks)
-                    line_start = segment.find(line) if line in segment else segment.find(raw_line.strip())
-                    if line_start == -1:
-                        line_start = 0
-                    rest = segment[line_start + len(line):].strip()
+                    # Use raw segment text after this line (robust to HTML line breaks); the offset
+                    # comes from the line lengths, so an earlier copy of the same text can't match
+                    rest = segment[offsets[idx + 1]:].strip()
                     # Cut at next section (line that starts with NO:, Classroom:, or subject)
                     take = []
                     for ln in rest.split("\n"):
                         ln = ln.strip()
                         if not ln:
                             continue
-                        if ln.lower().startswith("classroom:") or any(
-                            ln.lower().startswith(h.lower() + ":") or ln.lower().startswith(h.lower() + " ")
-                            for h in SUBJECT_HEADERS
-                        ):
+                        if _NEXT_SECTION_RE.match(ln.lower()):
                             break
                         take.append(ln)
                     rest = " ".join(take)
@@ -232,10 +424,7 @@ def _parse_page_text(text: str, url: str, person_name: str, class_label: Optiona
                         part = " ".join(lines[j].strip().split())
                         if not part:
                             continue
-                        if part.lower().startswith("classroom:") or any(
-                            part.lower().startswith(h.lower() + ":")
-                            for h in SUBJECT_HEADERS
-                        ):
+                        if _NEXT_SECTION_COLON_RE.match(part.lower()):
                             break
                         follow_parts.append(part)
                     follow = " ".join(follow_parts)
@@ -246,49 +435,66 @@ def _parse_page_text(text: str, url: str, person_name: str, class_label: Optiona
                         skip_count = len(follow_parts)
                         continue
                 highlights.append(f"**{header}:** {line}")
-            elif header in ("Idrott och hälsa", "Musik", "Bild") and (
-                "ta med" in line.lower() or "dusch" in line.lower() or "ombyte" in line.lower()
-            ):
-                highlights.append(f"**{header}:** {line}")
+            elif header in _PHYS_HEADERS:
+                if "ta med" in line_lower or "dusch" in line_lower or "ombyte" in line_lower:
+                    highlights.append(f"**{header}:** {line}")
 
-    # Deduplicate: normalize whitespace so "Prov  ->" and "Prov ->" merge
-    seen: set[str] = set()
-    unique: list[str] = []
+    # Deduplicate: normalize whitespace so "Prov  ->" and "Prov ->" merge (first spelling wins)
+    unique: dict[str, str] = {}
     for h in highlights:
-        normalized = " ".join(h.split())
-        if normalized not in seen:
-            seen.add(normalized)
-            unique.append(h)
+        unique.setdefault(" ".join(h.split()), h)
 
     return SchoolInfo(
         person_name=person_name,
         class_label=class_label,
         url=url,
         week=week,
-        highlights=unique,
+        highlights=list(unique.values()),
     )
 
 
-def fetch_school_info_for_person(
+def _parsed_cache_path(url: str) -> Path:
+    """Cache file for the parse result of a school page URL (one per URL, overwritten on change)."""
+    return http_cache.cache_path("school_parsed", url, ".json")
+
+
+def _parse_page_text_cached(
+    text: str, url: str, person_name: str, class_label: Optional[str], target_week: Optional[int]
+) -> SchoolInfo:
+    """
+    _parse_page_text plus the target-week filter, reusing the stored result when the same page text
+    was last parsed for the same target_week (CACHE_DIR/school_parsed).
+    """
+    path = _parsed_cache_path(url)
+    key = [_PARSED_CACHE_VERSION, target_week, hashlib.sha256(text.encode("utf-8")).hexdigest()]
+    entry = http_cache.read_entry(path, json.loads)
+    if entry is not None and entry.get("key") == key and "week" in entry and "highlights" in entry:
+        return SchoolInfo(
+            person_name=person_name,
+            class_label=class_label,
+            url=url,
+            week=entry["week"],
+            highlights=entry["highlights"],
+        )
+    info = _parse_page_text(text, url, person_name, class_label)
+    if target_week is not None and info.highlights:
+        info.highlights = _filter_highlights_for_week(info.highlights, target_week)
+    http_cache.write_entry(path, {"key": key, "week": info.week, "highlights": info.highlights}, _json_bytes)
+    return info
+
+
+def _school_info_from_page(
     person_name: str,
     class_label: Optional[str],
     url: str,
+    text: Union[str, Exception],
     target_week: Optional[int] = None,
 ) -> SchoolInfo:
-    """Fetch and parse one school class page for a person."""
+    """Parse fetched page text (or the exception from fetching it) into a SchoolInfo."""
     try:
-        text = _get_page_text(url)
-        info = _parse_page_text(text, url, person_name, class_label)
-        if target_week is not None and info.highlights:
-            info = SchoolInfo(
-                person_name=info.person_name,
-                class_label=info.class_label,
-                url=info.url,
-                week=info.week,
-                highlights=_filter_highlights_for_week(info.highlights, target_week),
-                error=info.error,
-            )
-        return info
+        if isinstance(text, Exception):
+            raise text
+        return _parse_page_text_cached(text, url, person_name, class_label, target_week)
     except Exception as e:
         return SchoolInfo(
             person_name=person_name,
@@ -300,6 +506,20 @@ def fetch_school_info_for_person(
         )
 
 
+def fetch_school_info_for_person(
+    person_name: str,
+    class_label: Optional[str],
+    url: str,
+    target_week: Optional[int] = None,
+) -> SchoolInfo:
+    """Fetch and parse one school class page for a person."""
+    try:
+        text: Union[str, Exception] = _get_page_text(url)
+    except Exception as e:
+        text = e
+    return _school_info_from_page(person_name, class_label, url, text, target_week)
+
+
 def fetch_all_school_info(target_week: Optional[int] = None) -> list[SchoolInfo]:
     """
     Fetch and parse all configured person school pages (from PERSON_SCHOOL).
@@ -320,30 +540,31 @@ def fetch_all_school_info(target_week: Optional[int] = None) -> list[SchoolInfo]
                 error="PERSON_SCHOOL not set in .env (format: Name|ClassLabel|URL,...)",
             )
         ]
+    texts = _get_page_texts([url for _, _, url in config.PERSON_SCHOOL])
     return [
-        fetch_school_info_for_person(person_name, class_label, url, target_week=target_week)
-        for person_name, class_label, url in config.PERSON_SCHOOL
+        _school_info_from_page(person_name, class_label, url, text, target_week=target_week)
+        for (person_name, class_label, url), text in zip(config.PERSON_SCHOOL, texts)
     ]
 
 
 def get_raw_page_text(url: str, timeout: float = 15.0) -> str:
     """Fetch URL and return full page text (strikethrough removed). For LLM extraction."""
-    return _get_page_text(url, timeout=timeout)
+    return _get_page_text(url, timeout=timeout, raw=True)
 
 
 def fetch_all_raw_school_texts() -> list[tuple[str, Optional[str], str, Optional[str], Optional[str]]]:
     """
-    Fetch raw page text for all configured school pages.
+    Fetch raw page text for all configured school pages (concurrently).
     Returns list of (person_name, class_label, url, raw_text, error).
     raw_text is None if fetch failed (error set).
     """
     if not config.PERSON_SCHOOL:
         return []
+    texts = _get_page_texts([url for _, _, url in config.PERSON_SCHOOL], raw=True)
     out: list[tuple[str, Optional[str], str, Optional[str], Optional[str]]] = []
-    for person_name, class_label, url in config.PERSON_SCHOOL:
-        try:
-            text = _get_page_text(url)
+    for (person_name, class_label, url), text in zip(config.PERSON_SCHOOL, texts):
+        if isinstance(text, Exception):
+            out.append((person_name, class_label, url, None, str(text)))
+        else:
             out.append((person_name, class_label, url, text, None))
-        except Exception as e:
-            out.append((person_name, class_label, url, None, str(e)))
     return out
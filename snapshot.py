@@ -1,7 +1,8 @@
 """
 Week snapshot for Sunday capture and weekday diff notifications.
 
-Snapshot format (JSON): iso_year, target_week, captured_at, school (highlights or hashes), calendar (events).
+Snapshot format (JSON): iso_year, target_week, captured_at, school (highlights or hashes), calendar (events,
+with a preformatted start_display).
 """
 
 from __future__ import annotations
@@ -9,17 +10,45 @@ from __future__ import annotations
 import hashlib
 import json
 import re
+from collections import defaultdict
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Sequence
 
 import config
 
+# Faster (de)serialization of snapshots when orjson is installed; stdlib json otherwise.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # events_by_person: list of (person_name, list[CalendarEvent])
 # CalendarEvent has summary, start (datetime), end (optional), location (optional)
 
+# Person names in PERSON_SCHOOL order (school_digest_highlights keys)
+_PERSON_NAMES = tuple(p[0] for p in config.PERSON_SCHOOL)
+
+# Section headings in a digest body (optional space after ##)
+_SKOLA_RE = re.compile(r"##\s*Skola\b")
+_KALENDER_RE = re.compile(r"##\s*Kalender\b")
+
+# Event time in notifications; stored per event as start_display so formatting needs no parsing
+_EVENT_TIME_FORMAT = "%a %d/%m %H:%M"
+
+
+@lru_cache(maxsize=8)
+def _person_heading_re(person_names: tuple[str, ...]) -> re.Pattern:
+    """
+    Matches heading text that is a person name, alone or followed by " ..." or "(...)".
+    Alternatives keep person_names order, so the first listed name wins as in a sequential check.
+    """
+    names = "|".join(re.escape(p) for p in person_names)
+    return re.compile(rf"(?:{names})(?=$| |\()")
+
 
-def parse_school_section_from_digest(digest_body: str, person_names: list[str]) -> dict[str, list[str]]:
+def parse_school_section_from_digest(digest_body: str, person_names: Sequence[str]) -> dict[str, list[str]]:
     """
     Parse the ## Skola section from a digest and return per-person highlight lines.
     person_names: list of names (e.g. from config.PERSON_SCHOOL first element).
@@ -27,14 +56,14 @@ def parse_school_section_from_digest(digest_body: str, person_names: list[str])
     out: dict[str, list[str]] = {p: [] for p in person_names}
     if not digest_body or not person_names:
         return out
-    # Find ## Skola ... ## Kalender (or end); allow optional space after ##
-    skola_match = re.search(r"##\s*Skola\b", digest_body)
+    # Find ## Skola ... ## Kalender (or end)
+    skola_match = _SKOLA_RE.search(digest_body)
     if not skola_match:
         return out
-    rest = digest_body[skola_match.start() :]
-    kal_match = re.search(r"##\s*Kalender\b", rest)
-    section = rest[: kal_match.start()] if kal_match else rest
+    kal_match = _KALENDER_RE.search(digest_body, skola_match.start())
+    section = digest_body[skola_match.start() : kal_match.start() if kal_match else len(digest_body)]
     lines = section.splitlines()
+    person_re = _person_heading_re(tuple(person_names))
     current_person: str | None = None
     for raw_line in lines:
         line = raw_line.strip()
@@ -54,13 +83,10 @@ def parse_school_section_from_digest(digest_body: str, person_names: list[str])
             else:
                 before_colon = ""
                 tail = ""
-            matched = None
-            for p in person_names:
-                if before_colon == p or before_colon.startswith(p + " ") or before_colon.startswith(p + "("):
-                    current_person = p
-                    matched = p
-                    break
+            m = person_re.match(before_colon)
+            matched = m.group(0) if m else None
             if matched is not None:
+                current_person = matched
                 # Only clear current_person when we see a real person heading; don't clear on **Svenska:** etc.
                 # Same-line content after person heading, e.g. "**Olle (8B):** **Svenska:** ..."
                 if tail.strip() and "**" in tail and ":" in tail:
@@ -73,8 +99,9 @@ def parse_school_section_from_digest(digest_body: str, person_names: list[str])
     return out
 
 
-def _event_key(ev: dict) -> tuple[str, str, str]:
-    return (ev["person"], ev["start"], ev["summary"])
+def _event_key(ev: dict) -> str:
+    """Identity of a snapshot event (person, start, summary) as one string (hashed once per lookup)."""
+    return f"{ev['person']}\x1f{ev['start']}\x1f{ev['summary']}"
 
 
 def build_snapshot(
@@ -100,14 +127,17 @@ def build_snapshot(
         "calendar": [],
     }
     if digest_body:
-        person_names = [p[0] for p in config.PERSON_SCHOOL]
-        snapshot["school_digest_highlights"] = parse_school_section_from_digest(digest_body, person_names)
+        snapshot["school_digest_highlights"] = parse_school_section_from_digest(digest_body, _PERSON_NAMES)
     if use_llm_extraction and raw_blocks is not None:
         snapshot["school_hashes"] = {}
+        snapshot["school_text_hashes"] = {}
         for person_name, _cl, raw_text, err in raw_blocks:
             text = (raw_text or "").strip()
             h = hashlib.sha256(text.encode("utf-8")).hexdigest()
             snapshot["school_hashes"][person_name] = h
+            # Whitespace-insensitive, so reflowed page text isn't reported as a change
+            normalized = " ".join(text.split())
+            snapshot["school_text_hashes"][person_name] = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
     elif school_infos is not None:
         snapshot["school_highlights"] = {}
         for info in school_infos:
@@ -119,6 +149,7 @@ def build_snapshot(
                 "person": person,
                 "summary": e.summary or "",
                 "start": e.start.isoformat(),
+                "start_display": e.start.strftime(_EVENT_TIME_FORMAT),
                 "end": e.end.isoformat() if e.end else None,
                 "location": e.location or None,
             }
@@ -138,7 +169,10 @@ def save_snapshot(snapshot: dict, path: Path | None = None) -> None:
     if path is None:
         path = snapshot_path(snapshot["iso_year"], snapshot["target_week"])
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(snapshot, ensure_ascii=False, indent=2), encoding="utf-8")
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(snapshot, option=orjson.OPT_INDENT_2))
+    else:
+        path.write_text(json.dumps(snapshot, ensure_ascii=False, indent=2), encoding="utf-8")
 
 
 def load_snapshot(iso_year: int, target_week: int) -> dict | None:
@@ -146,6 +180,8 @@ def load_snapshot(iso_year: int, target_week: int) -> dict | None:
     path = snapshot_path(iso_year, target_week)
     if not path.exists():
         return None
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
     return json.loads(path.read_text(encoding="utf-8"))
 
 
@@ -156,13 +192,16 @@ def diff_snapshots(
     """
     Compare stored and current snapshots.
     Returns (school_changed_persons, new_calendar_events).
-    School: if hashes, list person names where hash changed; if highlights, list person names with new lines (we treat any new line as "changed" for that person).
+    School: if hashes, list person names where hash changed (whitespace-insensitive when both snapshots have
+    school_text_hashes); if highlights, list person names with new lines (we treat any new line as "changed" for that person).
     Calendar: list of event dicts that are in current but not in stored (by person+start+summary).
     """
     school_changed: list[str] = []
-    if "school_hashes" in stored and "school_hashes" in current:
-        for person, cur_h in current["school_hashes"].items():
-            if stored["school_hashes"].get(person) != cur_h:
+    # Prefer whitespace-insensitive text hashes; snapshots from before they existed only have school_hashes
+    hash_key = "school_text_hashes" if "school_text_hashes" in stored else "school_hashes"
+    if hash_key in stored and hash_key in current:
+        for person, cur_h in current[hash_key].items():
+            if stored[hash_key].get(person) != cur_h:
                 school_changed.append(person)
     elif "school_highlights" in stored and "school_highlights" in current:
         for person, cur_highlights in current["school_highlights"].items():
@@ -170,7 +209,7 @@ def diff_snapshots(
             cur_set = set(cur_highlights or [])
             if cur_set - stored_set:
                 school_changed.append(person)
-    stored_keys = {_event_key(e) for e in stored.get("calendar") or []}
+    stored_keys = frozenset(_event_key(e) for e in stored.get("calendar") or [])
     new_events: list[dict] = []
     for e in current.get("calendar") or []:
         if _event_key(e) not in stored_keys:
@@ -204,20 +243,21 @@ def format_notification(
         parts.append("## Kalender")
         parts.append("")
         shown = new_events[:15]
-        by_person: dict[str, list[dict]] = {}
+        by_person: dict[str, list[dict]] = defaultdict(list)
         for e in shown:
-            person = e.get("person", "?")
-            by_person.setdefault(person, []).append(e)
-        for person in by_person:
+            by_person[e.get("person", "?")].append(e)
+        for person, person_events in by_person.items():
             parts.append(f"**{person}:**")
-            for e in by_person[person]:
-                start = e.get("start", "")
+            for e in person_events:
                 summary = e.get("summary", "")
-                try:
-                    dt = datetime.fromisoformat(start.replace("Z", "+00:00"))
-                    time_str = dt.strftime("%a %d/%m %H:%M")
-                except Exception:
-                    time_str = start[:16] if len(start) >= 16 else start
+                time_str = e.get("start_display")
+                if time_str is None:
+                    # Events from snapshots saved before start_display existed
+                    start = e.get("start", "")
+                    try:
+                        time_str = datetime.fromisoformat(start.replace("Z", "+00:00")).strftime(_EVENT_TIME_FORMAT)
+                    except ValueError:
+                        time_str = start[:16] if len(start) >= 16 else start
                 parts.append(f"• {time_str} – {summary}")
             parts.append("")
         if len(new_events) > 15: